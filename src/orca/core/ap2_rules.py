@@ -10,7 +10,7 @@ from .decision_contract import (
     create_decision_action,
     create_decision_reason,
 )
-from .rules_engine import AP2Rule, AP2RuleResult
+from .rules_engine import REQUIRES_GEO, REQUIRES_METADATA, AP2Rule, AP2RuleResult
 
 
 class AP2HighTicketRule(AP2Rule):
@@ -180,6 +180,9 @@ class AP2VelocityRule(AP2Rule):
 class AP2LocationMismatchRule(AP2Rule):
     """Rule that flags transactions with location mismatches for review."""
 
+    # Mismatch signals only come from contract metadata
+    required_mask = REQUIRES_METADATA
+
     def apply(self, ap2_contract: AP2DecisionContract) -> AP2RuleResult | None:
         """
         Apply the location mismatch rule to AP2 contract.
@@ -340,6 +343,8 @@ class AP2ChannelRiskRule(AP2Rule):
 class AP2GeoRiskRule(AP2Rule):
     """Rule that flags transactions from high-risk geographic locations."""
 
+    required_mask = REQUIRES_GEO
+
     def __init__(self, threshold: float = 0.6):
         """
         Initialize the AP2 geo risk rule.
@@ -4,12 +4,15 @@ This module provides adapters to convert between AP2-wrapped decision contracts
 and legacy decision request/response formats for backward compatibility.
 """
 
-import json
+import copy
+import secrets
 from datetime import UTC, datetime
 from decimal import Decimal
 from typing import Any
 from uuid import uuid4
 
+import orjson
+
 from ..mandates.ap2_types import (
     ActorType,
     AgentPresence,
@@ -34,6 +37,13 @@ from .decision_contract import (
     LegacyDecisionResponse,
 )
 
+# Placeholder cart item used when wrapping a legacy request (legacy has no line items)
+_LEGACY_ITEM_ID = "legacy_item_1"
+_LEGACY_ITEM_NAME = "Legacy Cart Item"
+_LEGACY_ITEM_DESCRIPTION = "Legacy item from legacy request"
+_LEGACY_ITEM_CATEGORY = "general"
+_LEGACY_ITEM_SKU = "legacy_001"
+
 
 class DecisionLegacyAdapter:
     """Adapter for converting between AP2 and legacy decision formats."""
@@ -47,8 +57,12 @@ class DecisionLegacyAdapter:
         if isinstance(legacy_request, dict):
             legacy_request = LegacyDecisionRequest(**legacy_request)
 
+        # Every value below is produced by this adapter from an already-validated
+        # LegacyDecisionRequest, so the nested models are built with model_construct.
+        # Only CartMandate validates, because its currency comes from the caller.
+
         # Create intent mandate from legacy request
-        intent = IntentMandate(
+        intent = IntentMandate.model_construct(
             actor=ActorType.HUMAN,  # Default assumption
             intent_type=IntentType.PURCHASE,  # Default assumption
             channel=_map_legacy_channel_to_ap2(legacy_request.channel),
@@ -61,22 +75,23 @@ class DecisionLegacyAdapter:
         )
 
         # Create cart mandate from legacy request
+        cart_amount = Decimal(str(legacy_request.cart_total))
         cart_items = [
-            CartItem(
-                id="legacy_item_1",
-                name="Legacy Cart Item",
+            CartItem.model_construct(
+                id=_LEGACY_ITEM_ID,
+                name=_LEGACY_ITEM_NAME,
                 quantity=1,
-                unit_price=Decimal(str(legacy_request.cart_total)),
-                total_price=Decimal(str(legacy_request.cart_total)),
-                description="Legacy item from legacy request",
-                category="general",
-                sku="legacy_001",
+                unit_price=cart_amount,
+                total_price=cart_amount,
+                description=_LEGACY_ITEM_DESCRIPTION,
+                category=_LEGACY_ITEM_CATEGORY,
+                sku=_LEGACY_ITEM_SKU,
             )
         ]
 
         cart = CartMandate(
             items=cart_items,
-            amount=Decimal(str(legacy_request.cart_total)),
+            amount=cart_amount,
             currency=legacy_request.currency,
             mcc="0000",  # Default MCC
             geo=None,  # No geo information in legacy
@@ -84,8 +99,8 @@ class DecisionLegacyAdapter:
         )
 
         # Create payment mandate from legacy request
-        payment = PaymentMandate(
-            instrument_ref=f"legacy_{uuid4().hex[:8]}",
+        payment = PaymentMandate.model_construct(
+            instrument_ref=f"legacy_{secrets.token_hex(4)}",
             modality=_map_legacy_rail_to_modality(legacy_request.rail),
             auth_requirements=[AuthRequirement.NONE],  # Default assumption
             instrument_token=None,  # No token in legacy
@@ -94,30 +109,31 @@ class DecisionLegacyAdapter:
         )
 
         # Create default decision outcome (will be filled by decision engine)
-        decision_outcome = DecisionOutcome(
+        decision_outcome = DecisionOutcome.model_construct(
             result="APPROVE",  # Default, will be overridden
             risk_score=0.0,  # Default, will be calculated
             reasons=[],
             actions=[],
-            meta=DecisionMeta(
+            meta=DecisionMeta.model_construct(
                 model="rules_only",  # Use valid model type
                 trace_id=str(uuid4()),
                 version="0.1.0",
-                processing_time_ms=0,  # Default processing time
+                processing_time_ms=0.0,  # Default processing time
                 model_version="0.1.0",  # Default model version
                 model_sha256="",  # Default empty hash
                 model_trained_on="",  # Default empty training date
             ),
         )
 
-        return AP2DecisionContract(
+        return AP2DecisionContract.model_construct(
             ap2_version="0.1.0",
             intent=intent,
             cart=cart,
             payment=payment,
             decision=decision_outcome,
             metadata={
-                "legacy_request": legacy_request.model_dump(),
+                # Fields are flat primitives/dicts, so a shallow copy matches model_dump()
+                "legacy_request": dict(legacy_request),
                 "conversion_timestamp": datetime.now(UTC).isoformat(),
             },
         )
@@ -129,77 +145,98 @@ class DecisionLegacyAdapter:
     ) -> LegacyDecisionResponse:
         """Convert AP2 decision contract to legacy decision response."""
 
+        decision = ap2_contract.decision
+        result = decision.result
+        cart_total = float(ap2_contract.cart.amount)
+
         # Map AP2 decision result to legacy decision string
-        legacy_decision = _map_ap2_result_to_legacy(ap2_contract.decision.result)
+        legacy_decision = _map_ap2_result_to_legacy(result)
 
-        # Extract reasons as strings
-        legacy_reasons = [str(reason.code) for reason in ap2_contract.decision.reasons]
+        # Extract reason codes once; shared by reasons, rules_evaluated and signals
+        reason_codes = [str(reason.code) for reason in decision.reasons]
+        legacy_reasons = reason_codes
 
         # Extract actions as strings
-        legacy_actions = [str(action.type) for action in ap2_contract.decision.actions]
+        legacy_actions = [str(action.type) for action in decision.actions]
 
         # Build legacy metadata
         legacy_meta = {
             "timestamp": datetime.now(UTC).isoformat(),
-            "transaction_id": ap2_contract.decision.meta.trace_id,
+            "transaction_id": decision.meta.trace_id,
             "rail": _map_ap2_modality_to_legacy_rail(ap2_contract.payment.modality),
             "channel": _map_ap2_channel_to_legacy(ap2_contract.intent.channel),
-            "cart_total": float(ap2_contract.cart.amount),
-            "risk_score": ap2_contract.decision.risk_score,
-            "rules_evaluated": [reason.code for reason in ap2_contract.decision.reasons],
+            "cart_total": cart_total,
+            "risk_score": decision.risk_score,
+            "rules_evaluated": reason_codes,
             "ap2_version": ap2_contract.ap2_version,
         }
 
         # Add approved amount if decision is APPROVE
-        if ap2_contract.decision.result == "APPROVE":
-            legacy_meta["approved_amount"] = float(ap2_contract.cart.amount)
+        if result == "APPROVE":
+            legacy_meta["approved_amount"] = cart_total
+
+        # Without enhanced fields, skip explanation generation entirely
+        if not include_enhanced_fields:
+            return LegacyDecisionResponse(
+                decision=legacy_decision,
+                reasons=legacy_reasons,
+                actions=legacy_actions,
+                meta=legacy_meta,
+                explanation="",  # Default empty explanation
+                explanation_human="",  # Default empty human explanation
+                routing_hint="",  # Default empty routing hint
+            )
 
-        response = LegacyDecisionResponse(
+        # Build the enhanced response in one construction instead of mutating it
+        return LegacyDecisionResponse(
             decision=legacy_decision,
             reasons=legacy_reasons,
             actions=legacy_actions,
             meta=legacy_meta,
-            explanation="",  # Default empty explanation
-            explanation_human="",  # Default empty human explanation
-            routing_hint="",  # Default empty routing hint
+            signals_triggered=list(reason_codes),
+            explanation=_generate_legacy_explanation(ap2_contract, reason_codes),
+            explanation_human=_generate_human_explanation(ap2_contract),
+            routing_hint=_generate_routing_hint(ap2_contract),
         )
 
-        # Add enhanced fields if requested
-        if include_enhanced_fields:
-            response.signals_triggered = [reason.code for reason in ap2_contract.decision.reasons]
-            response.explanation = _generate_legacy_explanation(ap2_contract)
-            response.explanation_human = _generate_human_explanation(ap2_contract)
-            response.routing_hint = _generate_routing_hint(ap2_contract)
-
-        return response
-
     @staticmethod
     def update_ap2_contract_with_legacy_response(
         ap2_contract: AP2DecisionContract,
         legacy_response: LegacyDecisionResponse | dict[str, Any],
+        validate: bool = True,
     ) -> AP2DecisionContract:
-        """Update AP2 contract with decision results from legacy response."""
+        """Update AP2 contract with decision results from legacy response.
 
-        if isinstance(legacy_response, dict):
+        Pass ``validate=False`` for trusted internal dicts (e.g. the round-trip
+        path) to read fields directly instead of building a LegacyDecisionResponse.
+        """
+
+        if isinstance(legacy_response, dict) and validate:
             legacy_response = LegacyDecisionResponse(**legacy_response)
 
+        # Work on (and store) a copy so the contract never shares state with the caller
+        if isinstance(legacy_response, dict):
+            legacy_response_data = copy.deepcopy(legacy_response)
+        else:
+            legacy_response_data = legacy_response.model_dump()
+
         # Map legacy decision to AP2 result
-        ap2_result = _map_legacy_to_ap2_result(legacy_response.decision)
+        ap2_result = _map_legacy_to_ap2_result(legacy_response_data["decision"])
 
-        # Convert legacy reasons to AP2 reasons
-        ap2_reasons = [
-            DecisionReason(code=reason, detail=f"Legacy reason: {reason}")  # type: ignore[arg-type]
-            for reason in legacy_response.reasons
-        ]
+        # Convert legacy reasons/actions; clean approvals usually carry none, so
+        # skip the comprehension entirely for empty inputs
+        legacy_reasons = legacy_response_data.get("reasons")
+        ap2_reasons = (
+            [_make_legacy_reason(reason) for reason in legacy_reasons] if legacy_reasons else []
+        )
 
-        # Convert legacy actions to AP2 actions
-        ap2_actions = [
-            DecisionAction(type=action, detail=f"Legacy action: {action}", to="")  # type: ignore[arg-type]
-            for action in legacy_response.actions
-        ]
+        legacy_actions = legacy_response_data.get("actions")
+        ap2_actions = (
+            [_make_legacy_action(action) for action in legacy_actions] if legacy_actions else []
+        )
 
         # Extract risk score from legacy metadata
-        risk_score = legacy_response.meta.get("risk_score", 0.0)
+        risk_score = (legacy_response_data.get("meta") or {}).get("risk_score", 0.0)
 
         # Update the decision outcome
         ap2_contract.decision.result = ap2_result  # type: ignore[assignment]
@@ -210,12 +247,28 @@ class DecisionLegacyAdapter:
         # Update metadata
         if ap2_contract.metadata is None:
             ap2_contract.metadata = {}
-        ap2_contract.metadata["legacy_response"] = legacy_response.model_dump()
+        ap2_contract.metadata["legacy_response"] = legacy_response_data
         ap2_contract.metadata["updated_timestamp"] = datetime.now(UTC).isoformat()
 
         return ap2_contract
 
 
+# Factories for legacy reasons/actions. Each call builds a new instance because
+# contracts are updated in place and must not share reasons/actions.
+def _make_legacy_reason(code: str) -> DecisionReason:
+    """Build an AP2 reason for a legacy reason code."""
+    return DecisionReason(code=code, detail=f"Legacy reason: {code}")  # type: ignore[arg-type]
+
+
+def _make_legacy_action(action_type: str) -> DecisionAction:
+    """Build an AP2 action for a legacy action code."""
+    return DecisionAction(
+        type=action_type,  # type: ignore[arg-type]
+        detail=f"Legacy action: {action_type}",
+        to="",
+    )
+
+
 # Helper functions for mapping between formats
 def _map_legacy_channel_to_ap2(legacy_channel: str) -> AP2ChannelType:
     """Map legacy channel to AP2 channel type."""
@@ -279,13 +332,17 @@ def _map_legacy_to_ap2_result(legacy_decision: str) -> str:
     return mapping.get(legacy_decision, "REVIEW")
 
 
-def _generate_legacy_explanation(ap2_contract: AP2DecisionContract) -> str:
+def _generate_legacy_explanation(
+    ap2_contract: AP2DecisionContract, reasons: list[str] | None = None
+) -> str:
     """Generate legacy-style explanation from AP2 contract."""
-    result = ap2_contract.decision.result
-    reasons = [reason.code for reason in ap2_contract.decision.reasons]
+    decision = ap2_contract.decision
+    result = decision.result
+    if reasons is None:
+        reasons = [reason.code for reason in decision.reasons]
 
     if result == "APPROVE":
-        return f"Transaction approved. Risk score: {ap2_contract.decision.risk_score:.3f}"
+        return f"Transaction approved. Risk score: {decision.risk_score:.3f}"
     elif result == "REVIEW":
         return f"Transaction requires review. Reasons: {', '.join(reasons)}"
     else:  # DECLINE
@@ -294,9 +351,10 @@ def _generate_legacy_explanation(ap2_contract: AP2DecisionContract) -> str:
 
 def _generate_human_explanation(ap2_contract: AP2DecisionContract) -> str:
     """Generate human-readable explanation from AP2 contract."""
+    cart = ap2_contract.cart
     result = ap2_contract.decision.result
-    amount = ap2_contract.cart.amount
-    currency = ap2_contract.cart.currency
+    amount = cart.amount
+    currency = cart.currency
 
     if result == "APPROVE":
         return f"Your {currency} {amount} transaction has been approved and will be processed."
@@ -308,7 +366,7 @@ def _generate_human_explanation(ap2_contract: AP2DecisionContract) -> str:
 
 def _generate_routing_hint(ap2_contract: AP2DecisionContract) -> str | None:
     """Generate routing hint from AP2 contract."""
-    actions = [action.type for action in ap2_contract.decision.actions]
+    actions = {action.type for action in ap2_contract.decision.actions}
 
     if "manual_review" in actions:
         return "ROUTE_TO_REVIEW"
@@ -323,8 +381,9 @@ def _generate_routing_hint(ap2_contract: AP2DecisionContract) -> str | None:
 # Convenience functions for JSON conversion
 def legacy_request_json_to_ap2_contract(json_str: str) -> AP2DecisionContract:
     """Convert legacy request JSON to AP2 contract."""
-    legacy_data = json.loads(json_str)
-    return DecisionLegacyAdapter.legacy_request_to_ap2_contract(legacy_data)
+    # Parse and validate in one pass instead of json -> dict -> LegacyDecisionRequest(**dict)
+    legacy_request = LegacyDecisionRequest.model_validate_json(json_str)
+    return DecisionLegacyAdapter.legacy_request_to_ap2_contract(legacy_request)
 
 
 def ap2_contract_to_legacy_response_json(
@@ -347,9 +406,9 @@ def roundtrip_legacy_to_ap2_to_legacy(
     ap2_contract = legacy_request_json_to_ap2_contract(legacy_request_json)
 
     # Update AP2 with legacy response
-    legacy_response = json.loads(legacy_response_json)
+    legacy_response = orjson.loads(legacy_response_json)
     updated_ap2 = DecisionLegacyAdapter.update_ap2_contract_with_legacy_response(
-        ap2_contract, legacy_response
+        ap2_contract, legacy_response, validate=False
     )
 
     # Convert back to legacy response
@@ -4,16 +4,220 @@ This module provides feature extraction from AP2 mandates for both rules engine
 and ML models, ensuring consistent feature mapping across the system.
 """
 
+from collections.abc import Sequence
 from datetime import UTC, datetime
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
+import numpy as np
+
 from ..mandates.ap2_types import (
+    ActorType,
+    AgentPresence,
+    AuthRequirement,
     CartMandate,
+    ChannelType,
     IntentMandate,
+    IntentType,
     PaymentMandate,
+    PaymentModality,
 )
 from .decision_contract import AP2DecisionContract
 
+# Static risk lookup tables, built once at import time. Tables for AP2 enum fields
+# are keyed by the enum members: validated mandates hold those same member objects,
+# so lookups resolve by identity, while plain strings still match via str equality.
+_CURRENCY_RISK = MappingProxyType(
+    {
+        "USD": 0.1,
+        "EUR": 0.1,
+        "GBP": 0.1,
+        "CAD": 0.1,
+        "AUD": 0.1,
+        "JPY": 0.2,
+        "CNY": 0.3,
+        "INR": 0.4,
+        "BRL": 0.3,
+        "MXN": 0.3,
+    }
+)
+
+_MCC_RISK = MappingProxyType(
+    {
+        "5733": 0.1,  # Electronics
+        "5411": 0.2,  # Groceries
+        "5812": 0.3,  # Restaurants
+        "7011": 0.4,  # Hotels
+        "7999": 0.5,  # Entertainment
+    }
+)
+
+_MODALITY_RISK = MappingProxyType(
+    {
+        PaymentModality.IMMEDIATE: 0.1,
+        PaymentModality.DEFERRED: 0.3,
+        PaymentModality.RECURRING: 0.4,
+        PaymentModality.INSTALLMENT: 0.5,
+    }
+)
+
+_AUTH_RISK = MappingProxyType(
+    {
+        AuthRequirement.NONE: 0.5,
+        AuthRequirement.PIN: 0.3,
+        AuthRequirement.BIOMETRIC: 0.2,
+        AuthRequirement.TWO_FACTOR: 0.1,
+        AuthRequirement.MULTI_FACTOR: 0.05,
+    }
+)
+
+_ACTOR_RISK = MappingProxyType(
+    {
+        ActorType.HUMAN: 0.1,
+        ActorType.AGENT: 0.3,
+        ActorType.SYSTEM: 0.5,
+    }
+)
+
+_CHANNEL_RISK = MappingProxyType(
+    {
+        ChannelType.WEB: 0.2,
+        ChannelType.MOBILE: 0.1,
+        ChannelType.API: 0.3,
+        ChannelType.VOICE: 0.4,
+        ChannelType.CHAT: 0.3,
+        ChannelType.POS: 0.1,
+    }
+)
+
+_AGENT_PRESENCE_RISK = MappingProxyType(
+    {
+        AgentPresence.NONE: 0.2,
+        AgentPresence.ASSISTED: 0.1,
+        AgentPresence.AUTONOMOUS: 0.4,
+    }
+)
+
+_INTENT_TYPE_RISK = MappingProxyType(
+    {
+        IntentType.PURCHASE: 0.1,
+        IntentType.REFUND: 0.3,
+        IntentType.TRANSFER: 0.4,
+        IntentType.SUBSCRIPTION: 0.2,
+        IntentType.DONATION: 0.3,
+        IntentType.INVESTMENT: 0.5,
+    }
+)
+
+_COUNTRY_RISK = MappingProxyType(
+    {
+        "US": 0.1,
+        "CA": 0.1,
+        "GB": 0.1,
+        "DE": 0.1,
+        "FR": 0.1,
+        "AU": 0.1,
+        "JP": 0.2,
+        "CN": 0.3,
+        "IN": 0.4,
+        "BR": 0.3,
+        "MX": 0.3,
+        "RU": 0.5,
+        "NG": 0.6,
+        "VE": 0.6,
+    }
+)
+
+# Legacy requests use a narrower country table
+_LEGACY_COUNTRY_RISK = MappingProxyType(
+    {
+        "US": 0.1,
+        "CA": 0.1,
+        "GB": 0.1,
+        "DE": 0.1,
+        "FR": 0.1,
+        "AU": 0.1,
+        "JP": 0.2,
+        "CN": 0.3,
+        "IN": 0.4,
+        "BR": 0.3,
+    }
+)
+
+_LEGACY_LOYALTY_SCORE = MappingProxyType(
+    {"BRONZE": 0.1, "SILVER": 0.2, "GOLD": 0.3, "PLATINUM": 0.4}
+)
+_LEGACY_RAIL_RISK = MappingProxyType({"Card": 0.2, "ACH": 0.3})
+_LEGACY_CHANNEL_RISK = MappingProxyType({"online": 0.2, "pos": 0.1})
+
+# Numeric legacy fields as (source key, feature name, default) triples
+_LEGACY_VELOCITY_FIELDS: tuple[tuple[str, str, float], ...] = (
+    ("velocity_24h", "velocity_24h", 1.0),
+    ("velocity_7d", "velocity_7d", 3.0),
+    ("velocity_30d", "velocity_30d", 10.0),
+)
+_LEGACY_CUSTOMER_FIELDS: tuple[tuple[str, str, float], ...] = (
+    ("account_age_days", "customer_age_days", 365.0),
+    ("chargebacks_12m", "chargebacks_12m", 0.0),
+)
+
+# Default model features for AP2 contracts; "amount" is filled in per contract.
+_MODEL_FEATURE_DEFAULTS: dict[str, float] = {
+    "amount": 0.0,
+    "velocity_24h": 1.0,  # from cart (defaults for now)
+    "velocity_7d": 1.0,
+    "cross_border": 0.0,  # from cart geo
+    "location_mismatch": 0.0,  # from cart geo
+    "payment_method_risk": 0.2,  # from payment
+    "chargebacks_12m": 0.0,  # customer data
+    "customer_age_days": 365.0,  # customer data
+    "loyalty_score": 0.0,  # customer data
+    "time_since_last_purchase": 0.0,  # customer data
+}
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_timestamp(raw: str) -> datetime:
+    """Parse an ISO timestamp into a timezone-aware datetime, cached per string."""
+    parsed = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed
+
+
+def _ingest_floats(
+    data: dict[str, Any], fields: tuple[tuple[str, str, float], ...], features: dict[str, float]
+) -> None:
+    """Copy numeric fields from legacy data into features as floats, with defaults."""
+    get = data.get
+    for key, feature_name, default in fields:
+        features[feature_name] = float(get(key, default))
+
+
+def _payment_method_risk(instrument_ref: str | None) -> float:
+    """Return the payment method risk implied by an instrument reference."""
+    if instrument_ref:
+        if "card_" in instrument_ref:
+            return 0.2
+        elif "bank_" in instrument_ref:
+            return 0.3
+    return 0.4
+
+
+def _default_for_feature(feature_name: str) -> float:
+    """Return the fallback value for a missing feature based on its name."""
+    if "risk" in feature_name:
+        return 0.3  # Default risk
+    elif "velocity" in feature_name:
+        return 1.0  # Default velocity
+    elif "age" in feature_name or "days" in feature_name:
+        return 365.0  # Default age
+    elif "count" in feature_name:
+        return 1.0  # Default count
+    else:
+        return 0.0  # Default value
+
 
 class AP2FeatureExtractor:
     """Feature extractor for AP2 mandates."""
@@ -33,6 +237,13 @@ class AP2FeatureExtractor:
             "loyalty_score",
             "time_since_last_purchase",
         ]
+        # Per-feature fallback values, classified once instead of on every call
+        self._feature_defaults = {name: _default_for_feature(name) for name in self.feature_names}
+        # Model feature defaults laid out in feature_names order for the array API
+        self._feature_vector_defaults = np.array(
+            [_MODEL_FEATURE_DEFAULTS[name] for name in self.feature_names], dtype=np.float64
+        )
+        self._amount_idx = self.feature_names.index("amount")
 
     def extract_features_from_ap2(
         self,
@@ -66,38 +277,69 @@ class AP2FeatureExtractor:
 
         return features
 
-    def _extract_model_features(self, ap2_contract: AP2DecisionContract) -> dict[str, float]:
-        """Extract only the features the model expects."""
-        features = {}
+    def extract_features_array(self, ap2_contract: AP2DecisionContract) -> np.ndarray:
+        """
+        Extract model features from AP2 decision contract as a vector.
 
-        # amount - from cart
-        features["amount"] = float(ap2_contract.cart.amount)
+        Values match extract_features_from_ap2 but are laid out in feature_names
+        order, ready to be passed to the model without building a dict first.
 
-        # velocity_24h, velocity_7d - from cart (using defaults for now)
-        features["velocity_24h"] = 1.0  # Default value
-        features["velocity_7d"] = 1.0  # Default value
+        Args:
+            ap2_contract: AP2 decision contract containing mandates
 
-        # cross_border - from cart geo
-        features["cross_border"] = 0.0  # Default value
+        Returns:
+            1-D float64 array with one slot per entry in feature_names
+        """
+        vector = self._feature_vector_defaults.copy()
+        vector[self._amount_idx] = float(ap2_contract.cart.amount)
+        return vector
+
+    def extract_features_batch(self, ap2_contracts: Sequence[AP2DecisionContract]) -> np.ndarray:
+        """
+        Extract model features for several AP2 decision contracts at once.
 
-        # location_mismatch - from cart geo
-        features["location_mismatch"] = 0.0  # Default value
+        Args:
+            ap2_contracts: AP2 decision contracts to extract features from
 
-        # payment_method_risk - from payment
-        features["payment_method_risk"] = 0.2  # Default value
+        Returns:
+            2-D float64 array of shape (len(ap2_contracts), len(feature_names)),
+            one row per contract in input order
+        """
+        batch = np.tile(self._feature_vector_defaults, (len(ap2_contracts), 1))
+        batch[:, self._amount_idx] = [float(contract.cart.amount) for contract in ap2_contracts]
+        return batch
 
-        # chargebacks_12m - customer data (default)
-        features["chargebacks_12m"] = 0.0  # Default value
+    def composite_risk_score(self, ap2_contract: AP2DecisionContract) -> float:
+        """
+        Calculate the composite risk score for an AP2 decision contract.
 
-        # customer_age_days - customer data (default)
-        features["customer_age_days"] = 365.0  # Default value
+        Averages actor, channel, modality, geo and payment method risk, matching
+        the composite_risk_score derived feature on the legacy path.
 
-        # loyalty_score - customer data (default)
-        features["loyalty_score"] = 0.0  # Default value
+        Args:
+            ap2_contract: AP2 decision contract containing mandates
 
-        # time_since_last_purchase - customer data (default)
-        features["time_since_last_purchase"] = 0.0  # Default value
+        Returns:
+            Composite risk score between 0.0 and 1.0
+        """
+        intent = ap2_contract.intent
+        payment = ap2_contract.payment
+        geo = ap2_contract.cart.geo
+        geo_risk = _COUNTRY_RISK.get(geo.country, 0.4) if geo else 0.5
+
+        return (
+            _ACTOR_RISK.get(intent.actor, 0.3)
+            + _CHANNEL_RISK.get(intent.channel, 0.3)
+            + _MODALITY_RISK.get(payment.modality, 0.3)
+            + geo_risk
+            + _payment_method_risk(payment.instrument_ref)
+        ) / 5.0
 
+    def _extract_model_features(self, ap2_contract: AP2DecisionContract) -> dict[str, float]:
+        """Extract only the features the model expects."""
+        # Only amount comes from the contract; everything else uses model defaults
+        features = _MODEL_FEATURE_DEFAULTS.copy()
+        features["amount"] = float(ap2_contract.cart.amount)
         return features
 
     def extract_features_from_legacy(self, legacy_data: dict[str, Any]) -> dict[str, float]:
@@ -136,30 +378,11 @@ class AP2FeatureExtractor:
         features["cart_total"] = float(cart.amount)
 
         # Currency risk (simplified mapping)
-        currency_risk_map = {
-            "USD": 0.1,
-            "EUR": 0.1,
-            "GBP": 0.1,
-            "CAD": 0.1,
-            "AUD": 0.1,
-            "JPY": 0.2,
-            "CNY": 0.3,
-            "INR": 0.4,
-            "BRL": 0.3,
-            "MXN": 0.3,
-        }
-        features["currency_risk"] = currency_risk_map.get(cart.currency, 0.5)
+        features["currency_risk"] = _CURRENCY_RISK.get(cart.currency, 0.5)
 
         # MCC risk (simplified mapping)
         if cart.mcc:
-            mcc_risk_map = {
-                "5733": 0.1,  # Electronics
-                "5411": 0.2,  # Groceries
-                "5812": 0.3,  # Restaurants
-                "7011": 0.4,  # Hotels
-                "7999": 0.5,  # Entertainment
-            }
-            features["mcc_risk"] = mcc_risk_map.get(cart.mcc, 0.3)
+            features["mcc_risk"] = _MCC_RISK.get(cart.mcc, 0.3)
         else:
             features["mcc_risk"] = 0.3  # Default risk for unknown MCC
 
@@ -174,40 +397,19 @@ class AP2FeatureExtractor:
         features = {}
 
         # Payment modality risk
-        modality_risk_map = {
-            "immediate": 0.1,
-            "deferred": 0.3,
-            "recurring": 0.4,
-            "installment": 0.5,
-        }
-        features["modality_risk"] = modality_risk_map.get(payment.modality, 0.3)
+        features["modality_risk"] = _MODALITY_RISK.get(payment.modality, 0.3)
 
         # Authentication requirement risk
-        auth_risk_map = {
-            "none": 0.5,
-            "pin": 0.3,
-            "biometric": 0.2,
-            "two_factor": 0.1,
-            "multi_factor": 0.05,
-        }
-
         if payment.auth_requirements:
             # Use the highest risk requirement
-            max_auth_risk = max(auth_risk_map.get(req, 0.3) for req in payment.auth_requirements)
+            auth_risk_get = _AUTH_RISK.get
+            max_auth_risk = max([auth_risk_get(req, 0.3) for req in payment.auth_requirements])
             features["auth_requirement_risk"] = max_auth_risk
         else:
             features["auth_requirement_risk"] = 0.5
 
         # Payment method risk (simplified)
-        if payment.instrument_ref:
-            if "card_" in payment.instrument_ref:
-                features["payment_method_risk"] = 0.2
-            elif "bank_" in payment.instrument_ref:
-                features["payment_method_risk"] = 0.3
-            else:
-                features["payment_method_risk"] = 0.4
-        else:
-            features["payment_method_risk"] = 0.4
+        features["payment_method_risk"] = _payment_method_risk(payment.instrument_ref)
 
         return features
 
@@ -216,42 +418,16 @@ class AP2FeatureExtractor:
         features = {}
 
         # Actor risk
-        actor_risk_map = {
-            "human": 0.1,
-            "agent": 0.3,
-            "system": 0.5,
-        }
-        features["actor_risk"] = actor_risk_map.get(intent.actor, 0.3)
+        features["actor_risk"] = _ACTOR_RISK.get(intent.actor, 0.3)
 
         # Channel risk
-        channel_risk_map = {
-            "web": 0.2,
-            "mobile": 0.1,
-            "api": 0.3,
-            "voice": 0.4,
-            "chat": 0.3,
-            "pos": 0.1,
-        }
-        features["channel_risk"] = channel_risk_map.get(intent.channel, 0.3)
+        features["channel_risk"] = _CHANNEL_RISK.get(intent.channel, 0.3)
 
         # Agent presence risk
-        agent_presence_risk_map = {
-            "none": 0.2,
-            "assisted": 0.1,
-            "autonomous": 0.4,
-        }
-        features["agent_presence_risk"] = agent_presence_risk_map.get(intent.agent_presence, 0.2)
+        features["agent_presence_risk"] = _AGENT_PRESENCE_RISK.get(intent.agent_presence, 0.2)
 
         # Intent type risk
-        intent_type_risk_map = {
-            "purchase": 0.1,
-            "refund": 0.3,
-            "transfer": 0.4,
-            "subscription": 0.2,
-            "donation": 0.3,
-            "investment": 0.5,
-        }
-        features["intent_type_risk"] = intent_type_risk_map.get(intent.intent_type, 0.3)
+        features["intent_type_risk"] = _INTENT_TYPE_RISK.get(intent.intent_type, 0.3)
 
         return features
 
@@ -261,23 +437,7 @@ class AP2FeatureExtractor:
 
         if cart.geo:
             # Country risk (simplified mapping)
-            country_risk_map = {
-                "US": 0.1,
-                "CA": 0.1,
-                "GB": 0.1,
-                "DE": 0.1,
-                "FR": 0.1,
-                "AU": 0.1,
-                "JP": 0.2,
-                "CN": 0.3,
-                "IN": 0.4,
-                "BR": 0.3,
-                "MX": 0.3,
-                "RU": 0.5,
-                "NG": 0.6,
-                "VE": 0.6,
-            }
-            features["geo_risk_score"] = country_risk_map.get(cart.geo.country, 0.4)
+            features["geo_risk_score"] = _COUNTRY_RISK.get(cart.geo.country, 0.4)
 
             # Cross-border indicator (simplified)
             features["cross_border"] = 1.0 if cart.geo.country != "US" else 0.0
@@ -300,7 +460,7 @@ class AP2FeatureExtractor:
             if isinstance(created_time_raw, str):  # type: ignore[unreachable]
                 # Parse ISO format
                 try:  # type: ignore[unreachable]
-                    created_time = datetime.fromisoformat(created_time_raw.replace("Z", "+00:00"))
+                    created_time = _parse_iso_timestamp(created_time_raw)
                 except ValueError:
                     created_time = datetime.now(UTC)
             else:
@@ -326,14 +486,12 @@ class AP2FeatureExtractor:
         features = {}
 
         # Amount features
-        features["amount"] = float(data.get("cart_total", 0.0))
-        features["cart_total"] = float(data.get("cart_total", 0.0))
+        amount = float(data.get("cart_total", 0.0))
+        features["amount"] = amount
+        features["cart_total"] = amount
 
         # Velocity features
-        features_data = data.get("features", {})
-        features["velocity_24h"] = float(features_data.get("velocity_24h", 1.0))
-        features["velocity_7d"] = float(features_data.get("velocity_7d", 3.0))
-        features["velocity_30d"] = float(features_data.get("velocity_30d", 10.0))
+        _ingest_floats(data.get("features", {}), _LEGACY_VELOCITY_FIELDS, features)
 
         return features
 
@@ -344,13 +502,11 @@ class AP2FeatureExtractor:
         context = data.get("context", {})
         customer = context.get("customer", {})
 
-        features["customer_age_days"] = float(customer.get("account_age_days", 365))
-        features["chargebacks_12m"] = float(customer.get("chargebacks_12m", 0))
+        _ingest_floats(customer, _LEGACY_CUSTOMER_FIELDS, features)
 
         # Loyalty score mapping
         loyalty_tier = customer.get("loyalty_tier", "BRONZE")
-        loyalty_map = {"BRONZE": 0.1, "SILVER": 0.2, "GOLD": 0.3, "PLATINUM": 0.4}
-        features["loyalty_score"] = loyalty_map.get(loyalty_tier, 0.1)
+        features["loyalty_score"] = _LEGACY_LOYALTY_SCORE.get(loyalty_tier, 0.1)
 
         return features
 
@@ -363,19 +519,7 @@ class AP2FeatureExtractor:
 
         # Country risk
         country = location.get("country", "US")
-        country_risk_map = {
-            "US": 0.1,
-            "CA": 0.1,
-            "GB": 0.1,
-            "DE": 0.1,
-            "FR": 0.1,
-            "AU": 0.1,
-            "JP": 0.2,
-            "CN": 0.3,
-            "IN": 0.4,
-            "BR": 0.3,
-        }
-        features["geo_risk_score"] = country_risk_map.get(country, 0.4)
+        features["geo_risk_score"] = _LEGACY_COUNTRY_RISK.get(country, 0.4)
 
         # Cross-border
         features["cross_border"] = 1.0 if country != "US" else 0.0
@@ -393,13 +537,11 @@ class AP2FeatureExtractor:
 
         # Rail-based risk
         rail = data.get("rail", "Card")
-        rail_risk_map = {"Card": 0.2, "ACH": 0.3}
-        features["payment_method_risk"] = rail_risk_map.get(rail, 0.3)
+        features["payment_method_risk"] = _LEGACY_RAIL_RISK.get(rail, 0.3)
 
         # Channel-based risk
         channel = data.get("channel", "online")
-        channel_risk_map = {"online": 0.2, "pos": 0.1}
-        features["channel_risk"] = channel_risk_map.get(channel, 0.2)
+        features["channel_risk"] = _LEGACY_CHANNEL_RISK.get(channel, 0.2)
 
         return features
 
@@ -418,52 +560,35 @@ class AP2FeatureExtractor:
 
     def _create_derived_features(self, features: dict[str, float]) -> dict[str, float]:
         """Create derived features from base features."""
-        derived = {}
-
-        # Amount-velocity ratio
-        amount = features.get("amount", 0.0)
-        velocity_24h = features.get("velocity_24h", 1.0)
-        derived["amount_velocity_ratio"] = amount / max(velocity_24h, 1.0)
+        get = features.get
+        amount = get("amount", 0.0)
+        velocity_24h = get("velocity_24h", 1.0)
+        modality_risk = get("modality_risk", 0.3)
+        geo_risk = get("geo_risk_score", 0.3)
 
-        # Risk-velocity interaction
-        base_risk = (
-            features.get("currency_risk", 0.3)
-            + features.get("mcc_risk", 0.3)
-            + features.get("modality_risk", 0.3)
-        ) / 3.0
-        derived["risk_velocity_interaction"] = base_risk * velocity_24h
-
-        # Location-velocity interaction
-        geo_risk = features.get("geo_risk_score", 0.3)
-        derived["location_velocity_interaction"] = geo_risk * velocity_24h
+        # Risk-velocity interaction base
+        base_risk = (get("currency_risk", 0.3) + get("mcc_risk", 0.3) + modality_risk) / 3.0
 
         # Composite risk score
         composite_risk = (
-            features.get("actor_risk", 0.3)
-            + features.get("channel_risk", 0.3)
-            + features.get("modality_risk", 0.3)
-            + features.get("geo_risk_score", 0.3)
-            + features.get("payment_method_risk", 0.3)
+            get("actor_risk", 0.3)
+            + get("channel_risk", 0.3)
+            + modality_risk
+            + geo_risk
+            + get("payment_method_risk", 0.3)
         ) / 5.0
-        derived["composite_risk_score"] = composite_risk
 
-        return derived
+        return {
+            "amount_velocity_ratio": amount / max(velocity_24h, 1.0),
+            "risk_velocity_interaction": base_risk * velocity_24h,
+            "location_velocity_interaction": geo_risk * velocity_24h,
+            "composite_risk_score": composite_risk,
+        }
 
     def _ensure_all_features(self, features: dict[str, float]) -> dict[str, float]:
         """Ensure all expected features are present with default values."""
-        for feature_name in self.feature_names:
-            if feature_name not in features:
-                # Set appropriate defaults based on feature type
-                if "risk" in feature_name:
-                    features[feature_name] = 0.3  # Default risk
-                elif "velocity" in feature_name:
-                    features[feature_name] = 1.0  # Default velocity
-                elif "age" in feature_name or "days" in feature_name:
-                    features[feature_name] = 365.0  # Default age
-                elif "count" in feature_name:
-                    features[feature_name] = 1.0  # Default count
-                else:
-                    features[feature_name] = 0.0  # Default value
+        for feature_name, default in self._feature_defaults.items():
+            features.setdefault(feature_name, default)
 
         return features
 
@@ -508,16 +633,10 @@ class AP2FeatureExtractor:
             raise ValueError("Intent must have 'created' timestamp")
 
 
-# Global feature extractor instance
-_feature_extractor: AP2FeatureExtractor | None = None
-
-
+@lru_cache(maxsize=1)
 def get_ap2_feature_extractor() -> AP2FeatureExtractor:
     """Get the global AP2 feature extractor instance."""
-    global _feature_extractor
-    if _feature_extractor is None:
-        _feature_extractor = AP2FeatureExtractor()
-    return _feature_extractor
+    return AP2FeatureExtractor()
 
 
 def extract_features_from_ap2(
@@ -528,6 +647,24 @@ def extract_features_from_ap2(
     return extractor.extract_features_from_ap2(ap2_contract, additional_features)
 
 
+def extract_features_array(ap2_contract: AP2DecisionContract) -> np.ndarray:
+    """Extract the model feature vector from AP2 contract using global extractor."""
+    extractor = get_ap2_feature_extractor()
+    return extractor.extract_features_array(ap2_contract)
+
+
+def extract_features_batch(ap2_contracts: Sequence[AP2DecisionContract]) -> np.ndarray:
+    """Extract model feature vectors for several AP2 contracts using global extractor."""
+    extractor = get_ap2_feature_extractor()
+    return extractor.extract_features_batch(ap2_contracts)
+
+
+def composite_risk_score(ap2_contract: AP2DecisionContract) -> float:
+    """Calculate the composite risk score for AP2 contract using global extractor."""
+    extractor = get_ap2_feature_extractor()
+    return extractor.composite_risk_score(ap2_contract)
+
+
 def extract_features_from_legacy(legacy_data: dict[str, Any]) -> dict[str, float]:
     """Extract features from legacy data using global extractor."""
     extractor = get_ap2_feature_extractor()
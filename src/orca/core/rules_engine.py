@@ -4,6 +4,10 @@ This module provides the rules engine that consumes AP2 mandates and produces
 structured decision outcomes with reasons and actions.
 """
 
+from collections import Counter
+from functools import lru_cache
+from types import MappingProxyType
+
 from .decision_contract import (
     AP2DecisionContract,
     DecisionAction,
@@ -11,9 +15,33 @@ from .decision_contract import (
     DecisionReason,
     create_decision_action,
     create_decision_reason,
-    sign_and_hash_decision,
 )
-from .feature_extractor import extract_features_from_ap2
+from .feature_extractor import composite_risk_score
+
+# Risk multiplier increment per triggered reason code; other codes add nothing
+_REASON_RISK_INCREMENTS = MappingProxyType(
+    {
+        "high_ticket": 0.2,
+        "velocity_flag": 0.3,
+        "location_mismatch": 0.4,
+        "high_risk": 0.5,
+    }
+)
+
+# Contract facets a rule can declare in ``AP2Rule.required_mask``. A rule is only
+# applied when every facet it requires is present on the contract.
+REQUIRES_GEO = 1 << 0  # cart.geo is set
+REQUIRES_METADATA = 1 << 1  # contract metadata is non-empty
+
+
+def _present_facets(ap2_contract: AP2DecisionContract) -> int:
+    """Return the bitmask of facets present on an AP2 contract."""
+    present = 0
+    if ap2_contract.cart.geo:
+        present |= REQUIRES_GEO
+    if ap2_contract.metadata:
+        present |= REQUIRES_METADATA
+    return present
 
 
 class AP2RuleResult:
@@ -41,6 +69,10 @@ class AP2RuleResult:
 class AP2Rule:
     """Abstract base class for AP2-compatible decision rules."""
 
+    # Bitmask of REQUIRES_* facets; rules that can never fire without them skip
+    # evaluation entirely. The default of 0 means the rule always runs.
+    required_mask: int = 0
+
     def apply(self, ap2_contract: AP2DecisionContract) -> AP2RuleResult | None:
         """
         Apply the rule to an AP2 decision contract.
@@ -62,9 +94,22 @@ class AP2Rule:
 class AP2RulesEngine:
     """AP2-compatible rules engine."""
 
-    def __init__(self) -> None:
-        """Initialize the AP2 rules engine."""
+    def __init__(self, adaptive: bool = False, reorder_interval: int = 1000) -> None:
+        """
+        Initialize the AP2 rules engine.
+
+        Args:
+            adaptive: Periodically move rules that DECLINE most often to the front,
+                so the DECLINE short-circuit is reached with fewer rule calls. Reasons
+                collected before a DECLINE then depend on traffic, so this is off by
+                default for deterministic output.
+            reorder_interval: Number of evaluations between reorders when adaptive
+        """
         self.rules: list[AP2Rule] = []
+        self.adaptive = adaptive
+        self.reorder_interval = reorder_interval
+        self._decline_hits: Counter[AP2Rule] = Counter()
+        self._evaluations = 0
         self._register_default_rules()
 
     def _register_default_rules(self) -> None:
@@ -112,17 +157,18 @@ class AP2RulesEngine:
         # Validate AP2 contract
         self._validate_ap2_contract(ap2_contract)
 
-        # Extract features for rule evaluation
-        features = extract_features_from_ap2(ap2_contract)
-
         # Start with APPROVE decision
         final_decision = "APPROVE"
         all_reasons: list[DecisionReason] = []
         all_actions: list[DecisionAction] = []
         rules_evaluated: list[str] = []
 
-        # Apply all rules
+        # Apply all rules whose required facets are present
+        present = _present_facets(ap2_contract)
         for rule in self.rules:
+            required = rule.required_mask
+            if required & present != required:
+                continue
             try:
                 result = rule.apply(ap2_contract)
                 if result:
@@ -135,6 +181,8 @@ class AP2RulesEngine:
                         final_decision = "REVIEW"
                     elif result.decision_hint == "DECLINE":
                         final_decision = "DECLINE"
+                        if self.adaptive:
+                            self._decline_hits[rule] += 1
                         break  # DECLINE is final
 
             except Exception as e:
@@ -142,7 +190,14 @@ class AP2RulesEngine:
                 print(f"Warning: Rule {rule.name} failed: {e}")
                 continue
 
-        # Calculate risk score from features
+        if self.adaptive:
+            self._evaluations += 1
+            if self._evaluations % self.reorder_interval == 0:
+                self._reorder_rules()
+
+        # Calculate risk score from the composite mandate risk. Only the base risk
+        # is needed here, so the full model feature set is not extracted.
+        features = {"composite_risk_score": composite_risk_score(ap2_contract)}
         risk_score = self._calculate_risk_score(features, all_reasons)
 
         # If no rules triggered, provide default approval
@@ -182,10 +237,9 @@ class AP2RulesEngine:
         # Update the contract with the decision outcome
         ap2_contract.decision = decision_outcome
 
-        # Sign and hash the decision if enabled
-        signed_contract = sign_and_hash_decision(ap2_contract)
-
-        return signed_contract.decision
+        # Signing only adds contract.signing, never changes the decision, so it is
+        # left to callers that emit the signed contract
+        return decision_outcome
 
     def _validate_ap2_contract(self, ap2_contract: AP2DecisionContract) -> None:
         """
@@ -234,19 +288,19 @@ class AP2RulesEngine:
         # Increase risk based on triggered reasons
         risk_multiplier = 1.0
         for reason in reasons:
-            if reason.code == "high_ticket":
-                risk_multiplier += 0.2
-            elif reason.code == "velocity_flag":
-                risk_multiplier += 0.3
-            elif reason.code == "location_mismatch":
-                risk_multiplier += 0.4
-            elif reason.code == "high_risk":
-                risk_multiplier += 0.5
+            risk_multiplier += _REASON_RISK_INCREMENTS.get(reason.code, 0.0)
 
         # Calculate final risk score
         final_risk = min(base_risk * risk_multiplier, 1.0)
         return final_risk
 
+    def _reorder_rules(self) -> None:
+        """Order rules by DECLINE hit count, keeping registration order for ties."""
+        hits = self._decline_hits
+        # Rebind rather than sort in place so concurrent evaluations keep iterating
+        # over a complete list
+        self.rules = sorted(self.rules, key=lambda rule: -hits[rule])
+
     def add_rule(self, rule: AP2Rule) -> None:
         """
         Add a custom rule to the engine.
@@ -275,16 +329,10 @@ class AP2RulesEngine:
         return [rule.name for rule in self.rules]
 
 
-# Global rules engine instance
-_rules_engine: AP2RulesEngine | None = None
-
-
+@lru_cache(maxsize=1)
 def get_ap2_rules_engine() -> AP2RulesEngine:
     """Get the global AP2 rules engine instance."""
-    global _rules_engine
-    if _rules_engine is None:
-        _rules_engine = AP2RulesEngine()
-    return _rules_engine
+    return AP2RulesEngine()
 
 
 def evaluate_ap2_rules(ap2_contract: AP2DecisionContract) -> DecisionOutcome:
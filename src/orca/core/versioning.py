@@ -4,6 +4,9 @@ This module provides versioning utilities for AP2 contracts and ML models,
 ensuring backward compatibility and smooth migration paths.
 """
 
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 from packaging import version
@@ -21,6 +24,36 @@ LEGACY_CONTENT_TYPE = "application/json"
 LEGACY_JSON_FLAG = "--legacy-json"
 AP2_JSON_FLAG = "--ap2-json"
 
+# Capabilities reported by get_supported_versions
+_AP2_FEATURES = (
+    "structured_decision_contract",
+    "ap2_mandates",
+    "signing_and_receipts",
+    "shap_explanations",
+    "feature_drift_guard",
+)
+_LEGACY_FEATURES = (
+    "basic_decision_response",
+    "simple_reason_codes",
+    "fallback_compatibility",
+)
+_ML_MODEL_FEATURES = (
+    "xgboost_inference",
+    "calibrated_scores",
+    "shap_explanations",
+    "feature_drift_guard",
+)
+_SUPPORTED_ML_MODEL_VERSIONS = ("1.0.0",)
+
+
+@lru_cache(maxsize=512)
+def _parse_version(version_str: str) -> version.Version | None:
+    """Parse a version string once, caching None for invalid versions."""
+    try:
+        return version.parse(version_str)
+    except version.InvalidVersion:
+        return None
+
 
 class VersionManager:
     """Manages versioning for AP2 contracts and ML models."""
@@ -63,12 +96,14 @@ class VersionManager:
         Returns:
             True if AP2 compatible
         """
-        try:
-            v = version.parse(version_str)
-            ap2_v = version.parse(self.ap2_version)
-            return bool(v >= ap2_v)
-        except version.InvalidVersion:
+        if version_str == self.ap2_version:
+            return True  # Common case: exactly the current AP2 version
+
+        v = _parse_version(version_str)
+        ap2_v = _parse_version(self.ap2_version)
+        if v is None or ap2_v is None:
             return False
+        return bool(v >= ap2_v)
 
     def is_legacy_version(self, version_str: str) -> bool:
         """Check if a version is legacy.
@@ -79,12 +114,14 @@ class VersionManager:
         Returns:
             True if legacy version
         """
-        try:
-            v = version.parse(version_str)
-            legacy_v = version.parse(self.legacy_version)
-            return bool(v < legacy_v)
-        except version.InvalidVersion:
+        if version_str == self.legacy_version:
+            return False  # The legacy version itself is not below the legacy version
+
+        v = _parse_version(version_str)
+        legacy_v = _parse_version(self.legacy_version)
+        if v is None or legacy_v is None:
             return True  # Assume legacy if can't parse
+        return bool(v < legacy_v)
 
     def get_model_version_from_meta(self, model_meta: dict[str, Any]) -> str:
         """Extract model version from model metadata.
@@ -109,10 +146,11 @@ class VersionManager:
         Returns:
             Version information dictionary
         """
+        use_ap2 = contract_type == "ap2"
         version_info = {
-            "contract_version": self.ap2_version if contract_type == "ap2" else self.legacy_version,
+            "contract_version": self.ap2_version if use_ap2 else self.legacy_version,
             "contract_type": contract_type,
-            "content_type": self.get_content_type(contract_type == "ap2"),
+            "content_type": AP2_CONTENT_TYPE if use_ap2 else LEGACY_CONTENT_TYPE,
         }
 
         if model_meta:
@@ -134,22 +172,21 @@ class VersionManager:
         Returns:
             Tuple of (is_compatible, message)
         """
-        try:
-            input_v = version.parse(input_version)
-            target_v = version.parse(target_version)
-
-            if input_v == target_v:
-                return True, "Versions match exactly"
-            elif input_v < target_v:
-                return (
-                    True,
-                    f"Input version {input_version} is compatible with target {target_version}",
-                )
-            else:
-                return False, f"Input version {input_version} is newer than target {target_version}"
-
-        except version.InvalidVersion as e:
-            return False, f"Invalid version format: {e}"
+        input_v = _parse_version(input_version)
+        target_v = _parse_version(target_version)
+
+        if input_v is None or target_v is None:
+            invalid = input_version if input_v is None else target_version
+            return False, f"Invalid version format: Invalid version: {invalid!r}"
+        elif input_v == target_v:
+            return True, "Versions match exactly"
+        elif input_v < target_v:
+            return (
+                True,
+                f"Input version {input_version} is compatible with target {target_version}",
+            )
+        else:
+            return False, f"Input version {input_version} is newer than target {target_version}"
 
     def get_migration_path(self, from_version: str, to_version: str) -> str | None:
         """Get migration path between versions.
@@ -176,94 +213,103 @@ class VersionManager:
         Returns:
             Dictionary of supported versions and their capabilities
         """
-        return {
-            "ap2": {
-                "version": self.ap2_version,
-                "content_type": AP2_CONTENT_TYPE,
-                "features": [
-                    "structured_decision_contract",
-                    "ap2_mandates",
-                    "signing_and_receipts",
-                    "shap_explanations",
-                    "feature_drift_guard",
-                ],
-                "migration_from": ["legacy"],
-            },
-            "legacy": {
-                "version": self.legacy_version,
-                "content_type": LEGACY_CONTENT_TYPE,
-                "features": [
-                    "basic_decision_response",
-                    "simple_reason_codes",
-                    "fallback_compatibility",
-                ],
-                "migration_to": ["ap2"],
-            },
-            "ml_models": {
-                "current_version": self.ml_model_version,
-                "supported_versions": ["1.0.0"],
-                "features": [
-                    "xgboost_inference",
-                    "calibrated_scores",
-                    "shap_explanations",
-                    "feature_drift_guard",
-                ],
-            },
+        return _to_builtin(
+            _supported_versions(self.ap2_version, self.legacy_version, self.ml_model_version)
+        )
+
+
+def _to_builtin(value: Any) -> Any:
+    """Copy read-only mappings and tuples into JSON-serializable dicts and lists."""
+    if isinstance(value, Mapping):
+        return {key: _to_builtin(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_to_builtin(item) for item in value]
+    return value
+
+
+@lru_cache(maxsize=8)
+def _supported_versions(
+    ap2_version: str, legacy_version: str, ml_model_version: str
+) -> Mapping[str, Any]:
+    """Build the supported versions payload once per set of current versions."""
+    return MappingProxyType(
+        {
+            "ap2": MappingProxyType(
+                {
+                    "version": ap2_version,
+                    "content_type": AP2_CONTENT_TYPE,
+                    "features": _AP2_FEATURES,
+                    "migration_from": ("legacy",),
+                }
+            ),
+            "legacy": MappingProxyType(
+                {
+                    "version": legacy_version,
+                    "content_type": LEGACY_CONTENT_TYPE,
+                    "features": _LEGACY_FEATURES,
+                    "migration_to": ("ap2",),
+                }
+            ),
+            "ml_models": MappingProxyType(
+                {
+                    "current_version": ml_model_version,
+                    "supported_versions": _SUPPORTED_ML_MODEL_VERSIONS,
+                    "features": _ML_MODEL_FEATURES,
+                }
+            ),
         }
+    )
 
 
-# Global version manager instance
-_version_manager: VersionManager | None = None
+# Global version manager instance, created at import since it only holds constants
+_version_manager = VersionManager()
 
 
 def get_version_manager() -> VersionManager:
     """Get global version manager instance."""
-    global _version_manager
-    if _version_manager is None:
-        _version_manager = VersionManager()
     return _version_manager
 
 
 def get_ap2_version() -> str:
     """Get current AP2 version."""
-    return get_version_manager().get_ap2_version()
+    return AP2_VERSION
 
 
 def get_ml_model_version() -> str:
     """Get current ML model version."""
-    return get_version_manager().get_ml_model_version()
+    return ML_MODEL_VERSION
 
 
 def get_content_type(use_ap2: bool = True) -> str:
     """Get appropriate content type header."""
-    return get_version_manager().get_content_type(use_ap2)
+    return AP2_CONTENT_TYPE if use_ap2 else LEGACY_CONTENT_TYPE
 
 
 def is_ap2_compatible(version_str: str) -> bool:
     """Check if a version is AP2 compatible."""
-    return get_version_manager().is_ap2_compatible(version_str)
+    return _version_manager.is_ap2_compatible(version_str)
 
 
 def is_legacy_version(version_str: str) -> bool:
     """Check if a version is legacy."""
-    return get_version_manager().is_legacy_version(version_str)
+    return _version_manager.is_legacy_version(version_str)
 
 
 def create_version_info(
     contract_type: str = "ap2", model_meta: dict[str, Any] | None = None
 ) -> dict[str, Any]:
     """Create version information dictionary."""
-    return get_version_manager().create_version_info(contract_type, model_meta)
+    return _version_manager.create_version_info(contract_type, model_meta)
 
 
 def get_migration_path(from_version: str, to_version: str) -> str | None:
     """Get migration path between versions."""
-    return get_version_manager().get_migration_path(from_version, to_version)
+    return _version_manager.get_migration_path(from_version, to_version)
 
 
 def get_supported_versions() -> dict[str, Any]:
     """Get information about supported versions."""
-    return get_version_manager().get_supported_versions()
+    return _version_manager.get_supported_versions()
 
 
 def attach_model_version_to_decision_meta(
@@ -278,22 +324,22 @@ def attach_model_version_to_decision_meta(
     Returns:
         Updated decision metadata with model version info
     """
-    # Create a copy to avoid modifying the original
-    updated_meta = decision_meta.copy()
-
-    # Add model version information
+    # Model version and versioning info, merged into a new dict so the original
+    # is not modified
     if model_meta:
-        updated_meta["model_version"] = model_meta.get("model_version", get_ml_model_version())
-        updated_meta["model_sha256"] = model_meta.get("model_sha256", "unknown")
-        updated_meta["model_trained_on"] = model_meta.get("trained_on", "unknown")
+        model_info = {
+            "model_version": model_meta.get("model_version", ML_MODEL_VERSION),
+            "model_sha256": model_meta.get("model_sha256", "unknown"),
+            "model_trained_on": model_meta.get("trained_on", "unknown"),
+            "version_info": create_version_info("ap2", model_meta),
+        }
     else:
-        updated_meta["model_version"] = get_ml_model_version()
-
-    # Add versioning info
-    version_info = create_version_info("ap2", model_meta)
-    updated_meta["version_info"] = version_info
+        model_info = {
+            "model_version": ML_MODEL_VERSION,
+            "version_info": create_version_info("ap2"),
+        }
 
-    return updated_meta
+    return decision_meta | model_info
 
 
 def validate_contract_version(contract_data: dict[str, Any]) -> tuple[bool, str]:
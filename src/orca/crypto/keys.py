@@ -5,11 +5,21 @@ decisions and generating receipt hashes.
 """
 
 import base64
+import hashlib
 import os
 
 from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import ed25519
+from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes, PublicKeyTypes
+
+
+def _getenv_bytes(name: str) -> bytes | None:
+    """Read an environment variable as bytes, without a str round trip where possible."""
+    if os.supports_bytes_environ:
+        return os.environb.get(name.encode("ascii"))
+    value = os.getenv(name)
+    return value.encode("utf-8") if value is not None else None
 
 
 class KeyManager:
@@ -20,6 +30,14 @@ class KeyManager:
         self._private_key: bytes | None = None
         self._public_key: bytes | None = None
         self._key_id: str | None = None
+        self._clear_parsed_keys()
+
+    def _clear_parsed_keys(self) -> None:
+        """Drop key objects and fingerprint derived from the previously loaded PEMs."""
+        self._private_key_obj: PrivateKeyTypes | None = None
+        self._public_key_obj: PublicKeyTypes | None = None
+        self._fingerprint: str | None = None
+        self._verification_method: str | None = None
 
     def load_keys_from_env(self) -> bool:
         """
@@ -30,22 +48,23 @@ class KeyManager:
         """
         try:
             # Load private key from environment
-            private_key_pem = os.getenv("ORCA_PRIVATE_KEY")
+            private_key_pem = _getenv_bytes("ORCA_PRIVATE_KEY")
             if not private_key_pem:
                 return False
 
             # Load public key from environment
-            public_key_pem = os.getenv("ORCA_PUBLIC_KEY")
+            public_key_pem = _getenv_bytes("ORCA_PUBLIC_KEY")
             if not public_key_pem:
                 return False
 
             # Load key ID from environment
             key_id = os.getenv("ORCA_KEY_ID", "orca-default-key")
 
-            # Parse and store keys
-            self._private_key = private_key_pem.encode("utf-8")
-            self._public_key = public_key_pem.encode("utf-8")
+            # Store keys; they are parsed on first use
+            self._private_key = private_key_pem
+            self._public_key = public_key_pem
             self._key_id = key_id
+            self._clear_parsed_keys()
 
             return True
 
@@ -77,10 +96,13 @@ class KeyManager:
                 format=serialization.PublicFormat.SubjectPublicKeyInfo,
             )
 
-            # Store keys
+            # Store keys, keeping the generated objects so they need no parsing
             self._private_key = private_pem
             self._public_key = public_pem
             self._key_id = "orca-test-key"
+            self._clear_parsed_keys()
+            self._private_key_obj = private_key
+            self._public_key_obj = public_key
 
             return True
 
@@ -106,6 +128,32 @@ class KeyManager:
         """
         return self._public_key
 
+    def get_private_key_object(self) -> PrivateKeyTypes | None:
+        """
+        Get the parsed private key, parsing the PEM only once per loaded key.
+
+        Returns:
+            Private key object or None if not loaded
+        """
+        if self._private_key_obj is None and self._private_key:
+            self._private_key_obj = serialization.load_pem_private_key(
+                self._private_key, password=None, backend=default_backend()
+            )
+        return self._private_key_obj
+
+    def get_public_key_object(self) -> PublicKeyTypes | None:
+        """
+        Get the parsed public key, parsing the PEM only once per loaded key.
+
+        Returns:
+            Public key object or None if not loaded
+        """
+        if self._public_key_obj is None and self._public_key:
+            self._public_key_obj = serialization.load_pem_public_key(
+                self._public_key, backend=default_backend()
+            )
+        return self._public_key_obj
+
     def get_key_id(self) -> str | None:
         """
         Get the key ID.
@@ -134,11 +182,14 @@ class KeyManager:
         if not self._public_key:
             return None
 
+        if self._fingerprint is not None:
+            return self._fingerprint
+
         try:
             # Parse public key
-            public_key = serialization.load_pem_public_key(
-                self._public_key, backend=default_backend()
-            )
+            public_key = self.get_public_key_object()
+            if public_key is None:
+                return None
 
             # Get public key bytes
             public_bytes = public_key.public_bytes(
@@ -147,17 +198,30 @@ class KeyManager:
             )
 
             # Calculate SHA-256 fingerprint
-            digest = hashes.Hash(hashes.SHA256(), backend=default_backend())
-            digest.update(public_bytes)
-            fingerprint = digest.finalize()
+            fingerprint = hashlib.sha256(public_bytes).digest()
 
-            # Return base64-encoded fingerprint
-            return base64.b64encode(fingerprint).decode("ascii")
+            # Cache the base64-encoded fingerprint for this key
+            self._fingerprint = base64.b64encode(fingerprint).decode("ascii")
+            return self._fingerprint
 
         except Exception as e:
             print(f"Failed to calculate key fingerprint: {e}")
             return None
 
+    def get_verification_method(self) -> str | None:
+        """
+        Get the VC verification method ("<key id>#<fingerprint>") for the loaded key.
+
+        Returns:
+            Verification method or None if the fingerprint is unavailable
+        """
+        if self._verification_method is None:
+            fingerprint = self.get_public_key_fingerprint()
+            if fingerprint is None:
+                return None
+            self._verification_method = f"{self._key_id}#{fingerprint}"
+        return self._verification_method
+
 
 # Global key manager instance
 _key_manager: KeyManager | None = None
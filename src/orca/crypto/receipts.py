@@ -5,9 +5,52 @@ immutable audit trails without storing sensitive data.
 """
 
 import hashlib
+import hmac
 import json
 from datetime import UTC, datetime
+from decimal import Decimal
 from typing import Any
+from uuid import UUID
+
+
+def _json_serializer(obj: Any) -> Any:
+    """Serialize datetime, Decimal, and UUID values for receipt JSON."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    elif isinstance(obj, Decimal | UUID):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+
+
+def _with_str_keys(value: Any) -> Any:
+    """
+    Return value with every dict key converted to the string JSON would emit.
+
+    Keys are converted before the receipt is encoded with sort_keys, so mixed
+    key types do not fail to sort and int keys keep their string ordering.
+    Containers without non-string keys are returned as-is.
+    """
+    if isinstance(value, dict):
+        converted = {}
+        changed = False
+        for key, item in value.items():
+            new_item = _with_str_keys(item)
+            if not isinstance(key, str):
+                if not isinstance(key, int | float) and key is not None:
+                    raise TypeError(
+                        f"keys must be str, int, float, bool or None, not {type(key).__name__}"
+                    )
+                key = json.dumps(key)
+                changed = True
+            elif new_item is not item:
+                changed = True
+            converted[key] = new_item
+        return converted if changed else value
+    if isinstance(value, list | tuple):
+        items = [_with_str_keys(item) for item in value]
+        if any(new is not old for new, old in zip(items, value, strict=True)):
+            return items
+    return value
 
 
 class ReceiptHasher:
@@ -31,7 +74,9 @@ class ReceiptHasher:
         receipt_data = self._create_receipt_data(decision_json)
 
         # Create canonical JSON
-        canonical_json = json.dumps(receipt_data, sort_keys=True, separators=(",", ":"))
+        canonical_json = json.dumps(
+            receipt_data, sort_keys=True, separators=(",", ":"), default=_json_serializer
+        )
 
         # Calculate SHA-256 hash
         receipt_hash = hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()
@@ -42,87 +87,65 @@ class ReceiptHasher:
         """
         Create receipt data from decision contract, excluding sensitive fields.
 
+        Only the containers that are changed are copied, so the input is never
+        modified. Non-string dict keys are converted to strings as JSON would;
+        datetime, Decimal and UUID values are left in place and serialized when
+        the receipt is encoded.
+
         Args:
             decision_json: Decision contract data
 
         Returns:
             Receipt data dictionary
         """
-
-        # Create a deep copy to avoid modifying original
-        # Handle datetime, Decimal, and UUID serialization
-        def json_serializer(obj: Any) -> Any:
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            elif hasattr(obj, "__class__") and obj.__class__.__name__ == "Decimal":
-                return str(obj)
-            elif hasattr(obj, "__class__") and obj.__class__.__name__ == "UUID":
-                return str(obj)
-            raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
-
-        receipt_data: dict[str, Any] = json.loads(
-            json.dumps(decision_json, default=json_serializer)
-        )
+        receipt_data = dict(_with_str_keys(decision_json))
 
         # Remove sensitive fields from cart
         if "cart" in receipt_data:
-            cart = receipt_data["cart"]
+            cart = receipt_data["cart"] = dict(receipt_data["cart"])
             if "items" in cart:
-                # Keep only essential item information
-                sanitized_items = []
-                for item in cart["items"]:
-                    sanitized_item = {
-                        "id": item.get("id"),
-                        "quantity": item.get("quantity"),
-                        # Exclude unit_price and total_price for privacy
-                    }
-                    sanitized_items.append(sanitized_item)
-                cart["items"] = sanitized_items
+                # Keep only essential item information; unit_price and total_price
+                # are excluded for privacy
+                cart["items"] = [
+                    {"id": item.get("id"), "quantity": item.get("quantity")}
+                    for item in cart["items"]
+                ]
 
             # Keep amount but remove individual item prices
             if "amount" in cart:
                 cart["amount"] = str(cart["amount"])  # Ensure string format
 
-        # Remove sensitive fields from payment
+        # Keep only modality and auth requirements from payment, which drops the
+        # instrument references
         if "payment" in receipt_data:
             payment = receipt_data["payment"]
-            # Remove instrument references
-            payment.pop("instrument_ref", None)
-            payment.pop("instrument_token", None)
-            # Keep only modality and auth requirements
-            payment = {
+            receipt_data["payment"] = {
                 "modality": payment.get("modality"),
                 "auth_requirements": payment.get("auth_requirements", []),
             }
-            receipt_data["payment"] = payment
 
-        # Remove sensitive fields from intent
+        # Keep only essential intent information, which drops the nonce
         if "intent" in receipt_data:
             intent = receipt_data["intent"]
-            # Remove nonce for privacy
-            intent.pop("nonce", None)
-            # Keep only essential intent information
-            intent = {
+            receipt_data["intent"] = {
                 "actor": intent.get("actor"),
                 "intent_type": intent.get("intent_type"),
                 "channel": intent.get("channel"),
                 "agent_presence": intent.get("agent_presence"),
                 "timestamps": intent.get("timestamps", {}),
             }
-            receipt_data["intent"] = intent
 
         # Keep decision outcome but remove sensitive metadata
         if "decision" in receipt_data:
-            decision = receipt_data["decision"]
+            decision = receipt_data["decision"] = dict(receipt_data["decision"])
             if "meta" in decision:
                 meta = decision["meta"]
                 # Keep only essential metadata
-                meta = {
+                decision["meta"] = {
                     "model": meta.get("model"),
                     "version": meta.get("version"),
                     "processing_time_ms": meta.get("processing_time_ms"),
                 }
-                decision["meta"] = meta
 
         # Remove signing information (will be added after signing)
         receipt_data.pop("signing", None)
@@ -146,12 +169,17 @@ class ReceiptHasher:
         Returns:
             True if receipt hash is valid, False otherwise
         """
+        # A SHA-256 hex digest is always 64 characters; reject anything else
+        # without rebuilding the receipt
+        if not isinstance(receipt_hash, str) or len(receipt_hash) != 64:
+            return False
+
         try:
             # Calculate expected hash
             expected_hash = self.make_receipt(decision_json)
 
-            # Compare hashes
-            return expected_hash == receipt_hash
+            # Compare hashes in constant time
+            return hmac.compare_digest(expected_hash, receipt_hash)
 
         except Exception as e:
             print(f"Receipt verification failed: {e}")
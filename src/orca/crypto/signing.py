@@ -4,15 +4,26 @@ This module provides verifiable credential (VC) signing for AP2 decision contrac
 """
 
 import base64
+import binascii
 import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+from json.encoder import encode_basestring_ascii
 from typing import Any
 
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import serialization
+from cryptography.exceptions import InvalidSignature, UnsupportedAlgorithm
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
+from cryptography.hazmat.primitives.asymmetric.types import PublicKeyTypes
 
 from .keys import get_key_manager
 
+logger = logging.getLogger(__name__)
+
+# Canonical JSON of a standard unsigned proof, keys in sorted order
+_CANONICAL_PROOF_TEMPLATE = '{"created":%s,"proofPurpose":%s,"type":%s,"verificationMethod":%s}'
+
 
 class VCSigner:
     """Signs AP2 decision contracts with verifiable credentials."""
@@ -32,7 +43,7 @@ class VCSigner:
             VC proof dictionary or None if signing failed
         """
         if not self.key_manager.is_loaded():
-            print("Warning: Keys not loaded, cannot sign decision")
+            logger.warning("Keys not loaded, cannot sign decision")
             return None
 
         try:
@@ -47,10 +58,46 @@ class VCSigner:
 
             return proof
 
-        except Exception as e:
-            print(f"Failed to sign decision: {e}")
+        except Exception:
+            logger.exception("Failed to sign decision")
             return None
 
+    def sign_decisions_bulk(
+        self, decisions: list[dict[str, Any]], max_workers: int | None = None
+    ) -> list[dict[str, Any] | None]:
+        """
+        Sign many decisions, e.g. when re-signing stored decisions after key rotation.
+
+        Ed25519 signing runs in native code, so on multi-core hosts the batch is
+        spread over a thread pool. With a single worker it is signed in order
+        on the calling thread.
+
+        Args:
+            decisions: AP2 decision contracts as dictionaries
+            max_workers: Thread pool size, defaults to the CPU count
+
+        Returns:
+            VC proof (or None if signing failed) for each decision, in input order
+        """
+        if not self.key_manager.is_loaded():
+            logger.warning("Keys not loaded, cannot sign decisions")
+            return [None] * len(decisions)
+
+        # Resolve the parsed key and verification method before fanning out
+        try:
+            self.key_manager.get_private_key_object()
+            self.key_manager.get_verification_method()
+        except Exception:
+            logger.exception("Failed to sign decisions")
+            return [None] * len(decisions)
+
+        workers = min(max_workers or os.cpu_count() or 1, len(decisions))
+        if workers <= 1:
+            return [self.sign_decision(decision) for decision in decisions]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.sign_decision, decisions))
+
     def _create_proof(self, decision_json: dict[str, Any]) -> dict[str, Any]:
         """
         Create the proof structure for signing.
@@ -61,23 +108,18 @@ class VCSigner:
         Returns:
             Proof structure dictionary
         """
-        # Get key information
-        key_id = self.key_manager.get_key_id()
-        public_key = self.key_manager.get_public_key()
-
-        if not public_key:
-            raise ValueError("Public key not available")
-
-        # Calculate public key fingerprint
-        fingerprint = self.key_manager.get_public_key_fingerprint()
-        if not fingerprint:
+        # Key id and fingerprint, cached by the key manager until keys are reloaded
+        verification_method = self.key_manager.get_verification_method()
+        if verification_method is None:
+            if not self.key_manager.get_public_key():
+                raise ValueError("Public key not available")
             raise ValueError("Could not calculate key fingerprint")
 
         # Create proof structure
         proof = {
             "type": "Ed25519Signature2020",
             "created": datetime.now(UTC).isoformat(),
-            "verificationMethod": f"{key_id}#{fingerprint}",
+            "verificationMethod": verification_method,
             "proofPurpose": "assertionMethod",
             "proofValue": "",  # Will be filled after signing
         }
@@ -94,29 +136,23 @@ class VCSigner:
         Returns:
             Base64-encoded signature
         """
-        private_key_pem = self.key_manager.get_private_key()
-        if not private_key_pem:
+        # Parsed once per loaded key by the key manager
+        private_key = self.key_manager.get_private_key_object()
+        if private_key is None:
             raise ValueError("Private key not available")
 
-        # Parse private key
-        private_key = serialization.load_pem_private_key(
-            private_key_pem, password=None, backend=default_backend()
-        )
-
         # Create canonical JSON for signing
         canonical_json = self._create_canonical_json(proof)
 
         # Sign the canonical JSON
         # For Ed25519 keys, we can sign directly
-        from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
-
         if isinstance(private_key, Ed25519PrivateKey):
             signature = private_key.sign(canonical_json.encode("utf-8"))
         else:
             raise ValueError(f"Unsupported key type: {type(private_key)}")
 
-        # Return base64-encoded signature
-        return base64.b64encode(signature).decode("ascii")
+        # Return base64-encoded signature (b64encode without its wrapper and newline strip)
+        return binascii.b2a_base64(signature, newline=False).decode("ascii")
 
     def _create_canonical_json(self, proof: dict[str, Any]) -> str:
         """
@@ -128,6 +164,18 @@ class VCSigner:
         Returns:
             Canonical JSON string
         """
+        # Fast path for the standard proof: exactly the four string fields (plus
+        # proofValue, which is never signed), emitted in sorted key order with the
+        # same escaping as json.dumps
+        fields = (
+            proof.get("created"),
+            proof.get("proofPurpose"),
+            proof.get("type"),
+            proof.get("verificationMethod"),
+        )
+        if len(proof) - ("proofValue" in proof) == 4 and all(type(f) is str for f in fields):
+            return _CANONICAL_PROOF_TEMPLATE % tuple(map(encode_basestring_ascii, fields))
+
         # Create a copy without the signature
         proof_copy = proof.copy()
         proof_copy.pop("proofValue", None)
@@ -149,44 +197,87 @@ class VCSigner:
             True if signature is valid, False otherwise
         """
         try:
-            # Get public key
-            public_key_pem = self.key_manager.get_public_key()
-            if not public_key_pem:
+            # Get public key, parsed once per loaded key by the key manager
+            public_key = self.key_manager.get_public_key_object()
+            if public_key is None:
                 return False
 
-            # Parse public key
-            public_key = serialization.load_pem_public_key(
-                public_key_pem, backend=default_backend()
-            )
+            return self._verify_proof(public_key, proof)
 
-            # Get signature
-            signature_b64 = proof.get("proofValue")
-            if not signature_b64:
-                return False
+        except Exception as e:
+            logger.warning("Signature verification failed: %r", e)
+            return False
 
-            # Decode signature
-            signature = base64.b64decode(signature_b64)
+    def verify_signatures_batch(
+        self, items: list[tuple[dict[str, Any], dict[str, Any]]]
+    ) -> list[bool]:
+        """
+        Verify many decision signatures, e.g. when auditing stored decisions.
 
-            # Create canonical JSON for verification
-            proof_copy = proof.copy()
-            proof_copy.pop("proofValue", None)
-            canonical_json = json.dumps(proof_copy, sort_keys=True, separators=(",", ":"))
+        The public key is resolved once for the whole batch. Each proof is still
+        checked individually, so one bad signature only fails its own entry.
 
-            # Verify signature
-            # For Ed25519 keys, we can verify directly
-            from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+        Args:
+            items: (decision_json, proof) pairs
+
+        Returns:
+            Verification result for each pair, in input order
+        """
+        try:
+            public_key = self.key_manager.get_public_key_object()
+        except (ValueError, UnsupportedAlgorithm) as e:
+            # The stored public key PEM could not be parsed
+            logger.warning("Signature verification failed: %r", e)
+            public_key = None
+        if public_key is None:
+            return [False] * len(items)
+
+        results = []
+        for _decision_json, proof in items:
+            try:
+                results.append(self._verify_proof(public_key, proof))
+            except (InvalidSignature, ValueError, TypeError, AttributeError) as e:
+                # Bad signature, invalid base64 (binascii.Error is a ValueError),
+                # unsupported key type, or a malformed proof
+                logger.warning("Signature verification failed: %r", e)
+                results.append(False)
+        return results
+
+    def _verify_proof(self, public_key: PublicKeyTypes, proof: dict[str, Any]) -> bool:
+        """
+        Verify a proof's signature with an already parsed public key.
 
-            if isinstance(public_key, Ed25519PublicKey):
-                public_key.verify(signature, canonical_json.encode("utf-8"))
-            else:
-                raise ValueError(f"Unsupported key type: {type(public_key)}")
+        Args:
+            public_key: Parsed public key
+            proof: VC proof with signature
 
-            return True
+        Returns:
+            True if signature is valid, False if the proof has no signature
 
-        except Exception as e:
-            print(f"Signature verification failed: {e}")
+        Raises:
+            InvalidSignature: If the signature does not match
+            ValueError: If the key type is not supported
+        """
+        # Get signature
+        signature_b64 = proof.get("proofValue")
+        if not signature_b64:
             return False
 
+        # Decode signature
+        signature = base64.b64decode(signature_b64)
+
+        # Create canonical JSON for verification
+        canonical_json = self._create_canonical_json(proof)
+
+        # Verify signature
+        # For Ed25519 keys, we can verify directly
+        if isinstance(public_key, Ed25519PublicKey):
+            public_key.verify(signature, canonical_json.encode("utf-8"))
+        else:
+            raise ValueError(f"Unsupported key type: {type(public_key)}")
+
+        return True
+
 
 # Global VC signer instance
 _vc_signer: VCSigner | None = None
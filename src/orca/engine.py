@@ -1,8 +1,40 @@
 """Orca decision engine."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any, Literal
 
+# Per-band decision metadata; each decision gets its own copy with the trace id
+_LOW_AMOUNT_META = MappingProxyType(
+    {
+        "routing_hint": "LOW_RISK_ROUTING",
+        "explain": "Low amount transaction approved automatically",
+    }
+)
+_HIGH_AMOUNT_META = MappingProxyType(
+    {
+        "routing_hint": "HIGH_RISK_ROUTING",
+        "explain": "High amount requires manual review",
+    }
+)
+_STANDARD_AMOUNT_META = MappingProxyType(
+    {
+        "routing_hint": "LOW_RISK_ROUTING",
+        "explain": "Standard amount approved with standard routing",
+    }
+)
+
+# Decision prototypes by amount band: low, standard, high
+_AmountBand = tuple[
+    Literal["APPROVE", "REVIEW"], float, tuple[str, ...], tuple[str, ...], Mapping[str, str]
+]
+_AMOUNT_BANDS: tuple[_AmountBand, ...] = (
+    ("APPROVE", 0.1, ("low_amount",), ("ROUTE:PROCESSOR_A",), _LOW_AMOUNT_META),
+    ("APPROVE", 0.3, ("standard_amount",), ("ROUTE:PROCESSOR_A",), _STANDARD_AMOUNT_META),
+    ("REVIEW", 0.7, ("high_amount",), ("STEP_UP:3DS",), _HIGH_AMOUNT_META),
+)
+
 
 @dataclass
 class Decision:
@@ -20,40 +52,15 @@ def decide(features: dict[str, Any]) -> Decision:
 
     # Simple rules engine for Phase 1
     amount = features.get("amount", 0)
+    trace_id = features.get("trace_id", "unknown")
 
-    if amount < 100:
-        return Decision(
-            decision="APPROVE",
-            risk_score=0.1,
-            reasons=["low_amount"],
-            actions=["ROUTE:PROCESSOR_A"],
-            meta={
-                "trace_id": features.get("trace_id", "unknown"),
-                "routing_hint": "LOW_RISK_ROUTING",
-                "explain": "Low amount transaction approved automatically",
-            },
-        )
-    elif amount > 1000:
-        return Decision(
-            decision="REVIEW",
-            risk_score=0.7,
-            reasons=["high_amount"],
-            actions=["STEP_UP:3DS"],
-            meta={
-                "trace_id": features.get("trace_id", "unknown"),
-                "routing_hint": "HIGH_RISK_ROUTING",
-                "explain": "High amount requires manual review",
-            },
-        )
-    else:
-        return Decision(
-            decision="APPROVE",
-            risk_score=0.3,
-            reasons=["standard_amount"],
-            actions=["ROUTE:PROCESSOR_A"],
-            meta={
-                "trace_id": features.get("trace_id", "unknown"),
-                "routing_hint": "LOW_RISK_ROUTING",
-                "explain": "Standard amount approved with standard routing",
-            },
-        )
+    # Band index: 0 below 100, 1 for the standard band, 2 above 1000
+    band = (not amount < 100) + (amount > 1000)
+    decision, risk_score, reasons, actions, meta = _AMOUNT_BANDS[band]
+    return Decision(
+        decision=decision,
+        risk_score=risk_score,
+        reasons=list(reasons),
+        actions=list(actions),
+        meta={"trace_id": trace_id, **meta},
+    )
@@ -4,63 +4,167 @@ This module generates human-readable explanations that explicitly cite AP2 field
 providing transparency and traceability for decision reasoning.
 """
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from ..core.decision_contract import AP2DecisionContract, DecisionAction, DecisionReason
 
+# Valid AP2 field paths, used to prevent hallucinated citations
+_FIELD_GUARDRAILS: frozenset[str] = frozenset(
+    {
+        # Intent mandate fields
+        "intent.actor",
+        "intent.intent_type",
+        "intent.channel",
+        "intent.agent_presence",
+        "intent.timestamps.created",
+        "intent.timestamps.expires",
+        "intent.nonce",
+        # Cart mandate fields
+        "cart.items",
+        "cart.amount",
+        "cart.currency",
+        "cart.mcc",
+        "cart.geo.country",
+        "cart.geo.city",
+        "cart.risk_flags",
+        # Payment mandate fields
+        "payment.instrument_ref",
+        "payment.instrument_token",
+        "payment.modality",
+        "payment.constraints",
+        "payment.routing_hints",
+        "payment.auth_requirements",
+        # Decision outcome fields
+        "decision.result",
+        "decision.risk_score",
+        "decision.reasons",
+        "decision.actions",
+        "decision.meta.model",
+        "decision.meta.trace_id",
+        "decision.meta.version",
+        # Signing fields
+        "signing.vc_proof",
+        "signing.receipt_hash",
+    }
+)
+
+# External mandate names mapped to internal field path prefixes
+_PATH_MAPPING = MappingProxyType(
+    {
+        "CartMandate": "cart",
+        "IntentMandate": "intent",
+        "PaymentMandate": "payment",
+        "DecisionOutcome": "decision",
+        "SigningInfo": "signing",
+    }
+)
+
+
+def _convert_to_internal_path(field_path: str) -> str:
+    """Convert external field path to internal format."""
+    # Convert "CartMandate.amount" to "cart.amount"
+    # Convert "IntentMandate.channel" to "intent.channel"
+    # etc.
+    parts = field_path.split(".")
+    if len(parts) >= 2:
+        mandate_type = parts[0]
+        if mandate_type in _PATH_MAPPING:
+            internal_mandate = _PATH_MAPPING[mandate_type]
+            field_name = ".".join(parts[1:])
+            return f"{internal_mandate}.{field_name}"
+
+    return field_path.lower()
+
+
+def _citation_values(ap2_contract: AP2DecisionContract) -> dict[str, Any]:
+    """Values of every citable AP2 field, with enum values read once per contract."""
+    intent = ap2_contract.intent
+    cart = ap2_contract.cart
+    payment = ap2_contract.payment
+    decision = ap2_contract.decision
+    return {
+        "CartMandate.amount": cart.amount,
+        "CartMandate.currency": cart.currency,
+        "CartMandate.geo.country": cart.geo.country if cart.geo else "unknown",
+        "IntentMandate.channel": intent.channel.value,
+        "IntentMandate.actor": intent.actor.value,
+        "PaymentMandate.modality": payment.modality.value,
+        "PaymentMandate.auth_requirements": [req.value for req in payment.auth_requirements],
+        "DecisionOutcome.result": decision.result,
+        "DecisionOutcome.risk_score": decision.risk_score,
+    }
+
+
+def _guardrailed_citations(table: dict[str, tuple[str, ...]]) -> Mapping[str, tuple[str, ...]]:
+    """Drop citation fields outside the guardrails, once at import rather than per citation."""
+    return MappingProxyType(
+        {
+            key: tuple(
+                field_path
+                for field_path in field_paths
+                if _convert_to_internal_path(field_path) in _FIELD_GUARDRAILS
+            )
+            for key, field_paths in table.items()
+        }
+    )
+
+
+# Reason codes mapped to the AP2 fields they cite, formatted only on lookup
+_REASON_CITATION_FIELDS = _guardrailed_citations(
+    {
+        "high_ticket": ("CartMandate.amount", "CartMandate.currency"),
+        "velocity_flag": ("IntentMandate.channel", "IntentMandate.actor"),
+        "ach_limit_exceeded": ("PaymentMandate.modality", "CartMandate.amount"),
+        "location_mismatch": ("CartMandate.geo.country", "IntentMandate.channel"),
+        "online_verification": ("IntentMandate.channel", "PaymentMandate.modality"),
+        "ach_online_verification": ("PaymentMandate.modality", "IntentMandate.channel"),
+        "chargeback_history": ("IntentMandate.actor",),
+        "high_risk": ("DecisionOutcome.risk_score", "DecisionOutcome.result"),
+    }
+)
+
+# Action types mapped to the AP2 fields they cite, formatted only on lookup
+_ACTION_CITATION_FIELDS = _guardrailed_citations(
+    {
+        "manual_review": ("DecisionOutcome.result", "IntentMandate.channel"),
+        "step_up_auth": ("PaymentMandate.auth_requirements", "IntentMandate.channel"),
+        "fallback_card": ("PaymentMandate.modality", "CartMandate.amount"),
+        "block_transaction": ("DecisionOutcome.result", "DecisionOutcome.risk_score"),
+        "micro_deposit_verification": ("PaymentMandate.modality", "IntentMandate.channel"),
+        "process_payment": ("DecisionOutcome.result", "PaymentMandate.modality"),
+        "send_confirmation": ("IntentMandate.channel", "DecisionOutcome.result"),
+    }
+)
+
+# Internal paths for every cited field, so validating a known citation is a single lookup
+_INTERNAL_PATH_BY_EXTERNAL = MappingProxyType(
+    {
+        field_path: _convert_to_internal_path(field_path)
+        for table in (_REASON_CITATION_FIELDS, _ACTION_CITATION_FIELDS)
+        for field_paths in table.values()
+        for field_path in field_paths
+    }
+)
+
 
 class AP2NLGExplainer:
     """Generates natural language explanations with AP2 field citations."""
 
     def __init__(self) -> None:
         """Initialize the AP2 NLG explainer."""
-        self.field_guardrails = self._build_field_guardrails()
-
-    def _build_field_guardrails(self) -> set[str]:
-        """Build set of valid AP2 field paths to prevent hallucination."""
-        return {
-            # Intent mandate fields
-            "intent.actor",
-            "intent.intent_type",
-            "intent.channel",
-            "intent.agent_presence",
-            "intent.timestamps.created",
-            "intent.timestamps.expires",
-            "intent.nonce",
-            # Cart mandate fields
-            "cart.items",
-            "cart.amount",
-            "cart.currency",
-            "cart.mcc",
-            "cart.geo.country",
-            "cart.geo.city",
-            "cart.risk_flags",
-            # Payment mandate fields
-            "payment.instrument_ref",
-            "payment.instrument_token",
-            "payment.modality",
-            "payment.constraints",
-            "payment.routing_hints",
-            "payment.auth_requirements",
-            # Decision outcome fields
-            "decision.result",
-            "decision.risk_score",
-            "decision.reasons",
-            "decision.actions",
-            "decision.meta.model",
-            "decision.meta.trace_id",
-            "decision.meta.version",
-            # Signing fields
-            "signing.vc_proof",
-            "signing.receipt_hash",
-        }
+        self.field_guardrails = _FIELD_GUARDRAILS
 
-    def explain_decision(self, ap2_contract: AP2DecisionContract) -> str:
+    def explain_decision(
+        self, ap2_contract: AP2DecisionContract, include_context: bool = True
+    ) -> str:
         """
         Generate a natural language explanation for an AP2 decision.
 
         Args:
             ap2_contract: AP2 decision contract to explain
+            include_context: Whether to append the AP2 context summary
 
         Returns:
             Human-readable explanation with AP2 field citations
@@ -81,100 +185,100 @@ class AP2NLGExplainer:
         if risk_score >= 0.1:
             explanation_parts.append(f"Risk score: {risk_score:.3f}")
 
-        # Add AP2 field citations for reasons
-        if reasons:
-            reason_explanations = self._explain_reasons_with_ap2_fields(reasons, ap2_contract)
-            explanation_parts.extend(reason_explanations)
+        # Cited field values, read once and shared by reasons, actions and context
+        citation_values: dict[str, Any] | None = None
+        if reasons or actions:
+            citation_values = _citation_values(ap2_contract)
 
-        # Add AP2 field citations for actions
-        if actions:
-            action_explanations = self._explain_actions_with_ap2_fields(actions, ap2_contract)
-            explanation_parts.extend(action_explanations)
+            # Add AP2 field citations for reasons
+            for reason in reasons:
+                explanation_parts.append(
+                    self._explain_single_reason_with_ap2_fields(reason, citation_values)
+                )
+
+            # Add AP2 field citations for actions
+            for action in actions:
+                explanation_parts.append(
+                    self._explain_single_action_with_ap2_fields(action, citation_values)
+                )
 
         # Add key AP2 field context
-        context_explanation = self._explain_ap2_context(ap2_contract)
-        if context_explanation:
-            explanation_parts.append(context_explanation)
+        if include_context:
+            context_explanation = self._explain_ap2_context(ap2_contract, citation_values)
+            if context_explanation:
+                explanation_parts.append(context_explanation)
 
         return ". ".join(explanation_parts) + "."
 
-    def _explain_reasons_with_ap2_fields(
-        self, reasons: list[DecisionReason], ap2_contract: AP2DecisionContract
-    ) -> list[str]:
-        """Explain decision reasons with AP2 field citations."""
-        explanations = []
-
-        for reason in reasons:
-            explanation = self._explain_single_reason_with_ap2_fields(reason, ap2_contract)
-            explanations.append(explanation)
-
-        return explanations
-
     def _explain_single_reason_with_ap2_fields(
-        self, reason: DecisionReason, ap2_contract: AP2DecisionContract
+        self, reason: DecisionReason, citation_values: dict[str, Any]
     ) -> str:
         """Explain a single reason with AP2 field citations."""
         reason_code = reason.code
         reason_detail = reason.detail
 
         # Map reason codes to AP2 field citations
-        ap2_citations = self._get_ap2_citations_for_reason(reason_code, ap2_contract)
+        fields = _REASON_CITATION_FIELDS.get(reason_code)
 
-        if ap2_citations:
-            citations_str = ", ".join(ap2_citations)
+        if fields:
+            citations_str = ", ".join(
+                [f"{field_path}={citation_values[field_path]}" for field_path in fields]
+            )
             return f"Reason '{reason_code}': {reason_detail} (AP2 fields: {citations_str})"
         else:
             return f"Reason '{reason_code}': {reason_detail}"
 
-    def _explain_actions_with_ap2_fields(
-        self, actions: list[DecisionAction], ap2_contract: AP2DecisionContract
-    ) -> list[str]:
-        """Explain decision actions with AP2 field citations."""
-        explanations = []
-
-        for action in actions:
-            explanation = self._explain_single_action_with_ap2_fields(action, ap2_contract)
-            explanations.append(explanation)
-
-        return explanations
-
     def _explain_single_action_with_ap2_fields(
-        self, action: DecisionAction, ap2_contract: AP2DecisionContract
+        self, action: DecisionAction, citation_values: dict[str, Any]
     ) -> str:
         """Explain a single action with AP2 field citations."""
         action_type = action.type
         action_detail = action.detail or ""
 
         # Map action types to AP2 field citations
-        ap2_citations = self._get_ap2_citations_for_action(action_type, ap2_contract)
+        fields = _ACTION_CITATION_FIELDS.get(action_type)
 
-        if ap2_citations:
-            citations_str = ", ".join(ap2_citations)
+        if fields:
+            citations_str = ", ".join(
+                [f"{field_path}={citation_values[field_path]}" for field_path in fields]
+            )
             return f"Action '{action_type}': {action_detail} (AP2 fields: {citations_str})"
         else:
             return f"Action '{action_type}': {action_detail}"
 
-    def _explain_ap2_context(self, ap2_contract: AP2DecisionContract) -> str:
-        """Explain key AP2 context fields."""
+    def _explain_ap2_context(
+        self, ap2_contract: AP2DecisionContract, citation_values: dict[str, Any] | None = None
+    ) -> str:
+        """Explain key AP2 context fields, reusing already read citation values if given."""
+        intent = ap2_contract.intent
+        cart = ap2_contract.cart
+        payment = ap2_contract.payment
+        if citation_values is None:
+            channel = intent.channel.value
+            actor = intent.actor.value
+            modality = payment.modality.value
+            auth_reqs = [req.value for req in payment.auth_requirements]
+        else:
+            channel = citation_values["IntentMandate.channel"]
+            actor = citation_values["IntentMandate.actor"]
+            modality = citation_values["PaymentMandate.modality"]
+            auth_reqs = citation_values["PaymentMandate.auth_requirements"]
+
         context_parts = []
 
         # Intent context
-        intent = ap2_contract.intent
-        context_parts.append(f"IntentMandate.channel={intent.channel.value}")
-        context_parts.append(f"IntentMandate.actor={intent.actor.value}")
+        context_parts.append(f"IntentMandate.channel={channel}")
+        context_parts.append(f"IntentMandate.actor={actor}")
 
         # Cart context
-        cart = ap2_contract.cart
         context_parts.append(f"CartMandate.amount={cart.amount}")
         context_parts.append(f"CartMandate.currency={cart.currency}")
         if cart.mcc:
             context_parts.append(f"CartMandate.mcc={cart.mcc}")
 
         # Payment context
-        payment = ap2_contract.payment
-        context_parts.append(f"PaymentMandate.modality={payment.modality.value}")
-        if payment.auth_requirements:
-            auth_reqs = [req.value for req in payment.auth_requirements]
+        context_parts.append(f"PaymentMandate.modality={modality}")
+        if auth_reqs:
             context_parts.append(f"PaymentMandate.auth_requirements={auth_reqs}")
 
         return f"AP2 context: {', '.join(context_parts)}"
@@ -183,102 +287,22 @@ class AP2NLGExplainer:
         self, reason_code: str, ap2_contract: AP2DecisionContract
     ) -> list[str]:
         """Get AP2 field citations for a specific reason code."""
-        citations = []
-
-        # Map reason codes to relevant AP2 fields
-        reason_field_mapping = {
-            "high_ticket": [
-                f"CartMandate.amount={ap2_contract.cart.amount}",
-                f"CartMandate.currency={ap2_contract.cart.currency}",
-            ],
-            "velocity_flag": [
-                f"IntentMandate.channel={ap2_contract.intent.channel.value}",
-                f"IntentMandate.actor={ap2_contract.intent.actor.value}",
-            ],
-            "ach_limit_exceeded": [
-                f"PaymentMandate.modality={ap2_contract.payment.modality.value}",
-                f"CartMandate.amount={ap2_contract.cart.amount}",
-            ],
-            "location_mismatch": [
-                f"CartMandate.geo.country={ap2_contract.cart.geo.country if ap2_contract.cart.geo else 'unknown'}",
-                f"IntentMandate.channel={ap2_contract.intent.channel.value}",
-            ],
-            "online_verification": [
-                f"IntentMandate.channel={ap2_contract.intent.channel.value}",
-                f"PaymentMandate.modality={ap2_contract.payment.modality.value}",
-            ],
-            "ach_online_verification": [
-                f"PaymentMandate.modality={ap2_contract.payment.modality.value}",
-                f"IntentMandate.channel={ap2_contract.intent.channel.value}",
-            ],
-            "chargeback_history": [
-                f"IntentMandate.actor={ap2_contract.intent.actor.value}",
-            ],
-            "high_risk": [
-                f"DecisionOutcome.risk_score={ap2_contract.decision.risk_score}",
-                f"DecisionOutcome.result={ap2_contract.decision.result}",
-            ],
-        }
-
-        if reason_code in reason_field_mapping:
-            citations = reason_field_mapping[reason_code]
-
-        # Validate citations against guardrails
-        validated_citations = []
-        for citation in citations:
-            if self._validate_field_citation(citation):
-                validated_citations.append(citation)
-
-        return validated_citations
+        return self._format_citations(_REASON_CITATION_FIELDS.get(reason_code, ()), ap2_contract)
 
     def _get_ap2_citations_for_action(
         self, action_type: str, ap2_contract: AP2DecisionContract
     ) -> list[str]:
         """Get AP2 field citations for a specific action type."""
-        citations = []
-
-        # Map action types to relevant AP2 fields
-        action_field_mapping = {
-            "manual_review": [
-                f"DecisionOutcome.result={ap2_contract.decision.result}",
-                f"IntentMandate.channel={ap2_contract.intent.channel.value}",
-            ],
-            "step_up_auth": [
-                f"PaymentMandate.auth_requirements={[req.value for req in ap2_contract.payment.auth_requirements]}",
-                f"IntentMandate.channel={ap2_contract.intent.channel.value}",
-            ],
-            "fallback_card": [
-                f"PaymentMandate.modality={ap2_contract.payment.modality.value}",
-                f"CartMandate.amount={ap2_contract.cart.amount}",
-            ],
-            "block_transaction": [
-                f"DecisionOutcome.result={ap2_contract.decision.result}",
-                f"DecisionOutcome.risk_score={ap2_contract.decision.risk_score}",
-            ],
-            "micro_deposit_verification": [
-                f"PaymentMandate.modality={ap2_contract.payment.modality.value}",
-                f"IntentMandate.channel={ap2_contract.intent.channel.value}",
-            ],
-            "process_payment": [
-                f"DecisionOutcome.result={ap2_contract.decision.result}",
-                f"PaymentMandate.modality={ap2_contract.payment.modality.value}",
-            ],
-            "send_confirmation": [
-                f"IntentMandate.channel={ap2_contract.intent.channel.value}",
-                f"DecisionOutcome.result={ap2_contract.decision.result}",
-            ],
-        }
-
-        if action_type in action_field_mapping:
-            citations = action_field_mapping[action_type]
-
-        # Validate citations against guardrails
-        validated_citations = []
-        for citation in citations:
-            if self._validate_field_citation(citation):
-                validated_citations.append(citation)
+        return self._format_citations(_ACTION_CITATION_FIELDS.get(action_type, ()), ap2_contract)
 
-        return validated_citations
+    def _format_citations(
+        self, fields: tuple[str, ...], ap2_contract: AP2DecisionContract
+    ) -> list[str]:
+        """Format pre-validated citation fields with contract values."""
+        if not fields:
+            return []
+        citation_values = _citation_values(ap2_contract)
+        return [f"{field_path}={citation_values[field_path]}" for field_path in fields]
 
     def _validate_field_citation(self, citation: str) -> bool:
         """
@@ -292,13 +316,12 @@ class AP2NLGExplainer:
         """
         try:
             # Extract field path from citation
-            if "=" in citation:
-                field_path = citation.split("=")[0]
-            else:
-                field_path = citation
+            field_path = citation.partition("=")[0]
 
             # Convert to internal field path format
-            internal_path = self._convert_to_internal_path(field_path)
+            internal_path = _INTERNAL_PATH_BY_EXTERNAL.get(field_path)
+            if internal_path is None:
+                internal_path = self._convert_to_internal_path(field_path)
 
             # Check against guardrails
             return internal_path in self.field_guardrails
@@ -308,27 +331,7 @@ class AP2NLGExplainer:
 
     def _convert_to_internal_path(self, field_path: str) -> str:
         """Convert external field path to internal format."""
-        # Convert "CartMandate.amount" to "cart.amount"
-        # Convert "IntentMandate.channel" to "intent.channel"
-        # etc.
-
-        path_mapping = {
-            "CartMandate": "cart",
-            "IntentMandate": "intent",
-            "PaymentMandate": "payment",
-            "DecisionOutcome": "decision",
-            "SigningInfo": "signing",
-        }
-
-        parts = field_path.split(".")
-        if len(parts) >= 2:
-            mandate_type = parts[0]
-            if mandate_type in path_mapping:
-                internal_mandate = path_mapping[mandate_type]
-                field_name = ".".join(parts[1:])
-                return f"{internal_mandate}.{field_name}"
-
-        return field_path.lower()
+        return _convert_to_internal_path(field_path)
 
     def explain_decision_legacy(
         self, decision_result: str, reasons: list[str], actions: list[str], context: dict[str, Any]
@@ -389,18 +392,19 @@ def get_ap2_nlg_explainer() -> AP2NLGExplainer:
     return _ap2_nlg_explainer
 
 
-def explain_ap2_decision(ap2_contract: AP2DecisionContract) -> str:
+def explain_ap2_decision(ap2_contract: AP2DecisionContract, include_context: bool = True) -> str:
     """
     Generate natural language explanation for AP2 decision.
 
     Args:
         ap2_contract: AP2 decision contract to explain
+        include_context: Whether to append the AP2 context summary
 
     Returns:
         Human-readable explanation with AP2 field citations
     """
     explainer = get_ap2_nlg_explainer()
-    return explainer.explain_decision(ap2_contract)
+    return explainer.explain_decision(ap2_contract, include_context)
 
 
 def explain_legacy_decision(
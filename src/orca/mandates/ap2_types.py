@@ -4,13 +4,34 @@ This module defines the core data structures for AP2 (Agent Protocol 2) complian
 including IntentMandate, CartMandate, and PaymentMandate types with validation.
 """
 
+import sys
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
+from types import MappingProxyType
 from typing import Any
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+# Commonly seen ISO 4217 codes, accepted by a single lookup that also returns the
+# interned literal. Other codes still go through the format check.
+_KNOWN_CURRENCIES = MappingProxyType(
+    {
+        code: code
+        for code in (
+            "AED", "ARS", "AUD", "BRL", "CAD", "CHF", "CLP", "CNY", "COP", "CZK",
+            "DKK", "EGP", "EUR", "GBP", "HKD", "HUF", "IDR", "ILS", "INR", "JPY",
+            "KES", "KRW", "MXN", "MYR", "NGN", "NOK", "NZD", "PEN", "PHP", "PKR",
+            "PLN", "RON", "RUB", "SAR", "SEK", "SGD", "THB", "TRY", "TWD", "UAH",
+            "USD", "VND", "ZAR",
+        )
+    }
+)  # fmt: skip
+
+# AP2 mandates are immutable once validated. Unknown fields are still ignored:
+# published AP2 payloads carry extras such as cart.geo.ip_country
+_MANDATE_CONFIG = ConfigDict(frozen=True)
 
 
 class ActorType(str, Enum):
@@ -82,6 +103,8 @@ class RiskFlag(str, Enum):
 class CartItem(BaseModel):
     """Individual item in a cart."""
 
+    model_config = _MANDATE_CONFIG
+
     id: str = Field(..., description="Unique item identifier")
     name: str = Field(..., description="Item name")
     description: str | None = Field(None, description="Item description")
@@ -105,6 +128,8 @@ class CartItem(BaseModel):
 class GeoLocation(BaseModel):
     """Geographic location information."""
 
+    model_config = _MANDATE_CONFIG
+
     country: str = Field(..., description="Country code (ISO 3166-1 alpha-2)")
     region: str | None = Field(None, description="Region/state")
     city: str | None = Field(None, description="City")
@@ -112,10 +137,18 @@ class GeoLocation(BaseModel):
     longitude: float | None = Field(None, ge=-180, le=180, description="Longitude")
     timezone: str | None = Field(None, description="Timezone identifier")
 
+    @field_validator("country")
+    @classmethod
+    def intern_country(cls, v: str) -> str:
+        """Intern the country code so risk table lookups can match by identity."""
+        return sys.intern(v)
+
 
 class RoutingHint(BaseModel):
     """Payment routing hints."""
 
+    model_config = _MANDATE_CONFIG
+
     processor: str = Field(..., description="Payment processor identifier")
     priority: int = Field(..., ge=1, le=10, description="Routing priority (1=highest)")
     constraints: dict[str, Any] | None = Field(None, description="Additional routing constraints")
@@ -124,6 +157,8 @@ class RoutingHint(BaseModel):
 class IntentMandate(BaseModel):
     """AP2 Intent Mandate - Defines the actor's intent and context."""
 
+    model_config = _MANDATE_CONFIG
+
     actor: ActorType = Field(..., description="Type of actor expressing intent")
     intent_type: IntentType = Field(..., description="Type of intent being expressed")
     channel: ChannelType = Field(..., description="Communication channel")
@@ -135,17 +170,11 @@ class IntentMandate(BaseModel):
     @field_validator("timestamps")
     @classmethod
     def validate_timestamps(cls, v: Any) -> Any:
-        """Validate that timestamps contains required keys."""
+        """Validate that timestamps contains created and expires, in that order."""
         required_keys = {"created", "expires"}
         if not required_keys.issubset(v.keys()):
             missing = required_keys - set(v.keys())
             raise ValueError(f"Missing required timestamp keys: {missing}")
-        return v
-
-    @field_validator("timestamps")
-    @classmethod
-    def validate_timestamp_order(cls, v: Any) -> Any:
-        """Validate that created timestamp is before expires timestamp."""
         if v["created"] >= v["expires"]:
             raise ValueError("created timestamp must be before expires timestamp")
         return v
@@ -154,6 +183,8 @@ class IntentMandate(BaseModel):
 class CartMandate(BaseModel):
     """AP2 Cart Mandate - Defines the shopping cart contents and context."""
 
+    model_config = _MANDATE_CONFIG
+
     items: list[CartItem] = Field(..., min_length=1, description="Cart items")
     amount: Decimal = Field(..., ge=0, description="Total cart amount")
     currency: str = Field(..., min_length=3, max_length=3, description="Currency code (ISO 4217)")
@@ -166,8 +197,12 @@ class CartMandate(BaseModel):
     @classmethod
     def validate_amount(cls, v: Any, info: Any) -> Any:
         """Validate that amount equals sum of item total prices."""
-        if info.data and "items" in info.data:
-            expected = sum(item.total_price for item in info.data["items"])
+        items = info.data.get("items") if info.data else None
+        if items is not None:
+            # Plain accumulator loop, no generator frame per validation
+            expected = Decimal(0)
+            for item in items:
+                expected += item.total_price
             if v != expected:
                 raise ValueError(f"amount {v} must equal sum of item total prices ({expected})")
         return v
@@ -176,14 +211,26 @@ class CartMandate(BaseModel):
     @classmethod
     def validate_currency(cls, v: Any) -> Any:
         """Validate currency code format."""
+        known = _KNOWN_CURRENCIES.get(v)
+        if known is not None:
+            return known
         if not v.isalpha() or not v.isupper():
             raise ValueError("currency must be a 3-letter uppercase code")
-        return v
+        # Interned so risk table lookups can match by identity
+        return sys.intern(v)
+
+    @field_validator("mcc")
+    @classmethod
+    def intern_mcc(cls, v: str | None) -> str | None:
+        """Intern the merchant category code so risk table lookups can match by identity."""
+        return sys.intern(v) if v is not None else None
 
 
 class PaymentMandate(BaseModel):
     """AP2 Payment Mandate - Defines payment instrument and processing requirements."""
 
+    model_config = _MANDATE_CONFIG
+
     instrument_ref: str | None = Field(None, description="Payment instrument reference")
     instrument_token: str | None = Field(None, description="Payment instrument token")
     modality: PaymentModality = Field(..., description="Payment processing modality")
@@ -205,40 +252,71 @@ class PaymentMandate(BaseModel):
 
 
 # Validation helper functions
-def validate_intent(data: dict[str, Any] | str) -> IntentMandate:
-    """Validate and create an IntentMandate from JSON data."""
-    if isinstance(data, str):
-        import json
+def validate_intent(data: dict[str, Any] | str, trusted: bool = False) -> IntentMandate:
+    """
+    Validate and create an IntentMandate from JSON data.
 
-        data_dict: dict[str, Any] = json.loads(data)
-    else:
-        data_dict = data
+    With trusted=True an already typed dict, such as model_dump() output from a
+    trusted store, is constructed without validation. JSON strings are always validated.
+    """
+    if isinstance(data, str):
+        return IntentMandate.model_validate_json(data)
+    if trusted:
+        return IntentMandate.model_construct(**data)
+    return IntentMandate.model_validate(data)
 
-    return IntentMandate(**data_dict)
 
+def validate_cart(data: dict[str, Any] | str, trusted: bool = False) -> CartMandate:
+    """
+    Validate and create a CartMandate from JSON data.
 
-def validate_cart(data: dict[str, Any] | str) -> CartMandate:
-    """Validate and create a CartMandate from JSON data."""
+    With trusted=True an already typed dict, such as model_dump() output from a
+    trusted store, is constructed without validation. JSON strings are always validated.
+    """
     if isinstance(data, str):
-        import json
-
-        data_dict: dict[str, Any] = json.loads(data)
-    else:
-        data_dict = data
+        return CartMandate.model_validate_json(data)
+    if trusted:
+        return _construct_cart(data)
+    return CartMandate.model_validate(data)
 
-    return CartMandate(**data_dict)
 
+def validate_payment(data: dict[str, Any] | str, trusted: bool = False) -> PaymentMandate:
+    """
+    Validate and create a PaymentMandate from JSON data.
 
-def validate_payment(data: dict[str, Any] | str) -> PaymentMandate:
-    """Validate and create a PaymentMandate from JSON data."""
+    With trusted=True an already typed dict, such as model_dump() output from a
+    trusted store, is constructed without validation. JSON strings are always validated.
+    """
     if isinstance(data, str):
-        import json
-
-        data_dict: dict[str, Any] = json.loads(data)
-    else:
-        data_dict = data
-
-    return PaymentMandate(**data_dict)
+        return PaymentMandate.model_validate_json(data)
+    if trusted:
+        return _construct_payment(data)
+    return PaymentMandate.model_validate(data)
+
+
+def _construct_cart(data: dict[str, Any]) -> CartMandate:
+    """Build a CartMandate and its nested models from trusted data without validation."""
+    fields = dict(data)
+    fields["items"] = [
+        CartItem.model_construct(**item) if isinstance(item, dict) else item
+        for item in data["items"]
+    ]
+    geo = data.get("geo")
+    if isinstance(geo, dict):
+        fields["geo"] = GeoLocation.model_construct(**geo)
+    return CartMandate.model_construct(**fields)
+
+
+def _construct_payment(data: dict[str, Any]) -> PaymentMandate:
+    """Build a PaymentMandate and its routing hints from trusted data without validation."""
+    fields = dict(data)
+    routing_hints = data.get("routing_hints")
+    if routing_hints:
+        fields["routing_hints"] = [
+            RoutingHint.model_construct(**hint) if isinstance(hint, dict) else hint
+            for hint in routing_hints
+        ]
+    return PaymentMandate.model_construct(**fields)
 
 
 # JSON serialization helpers
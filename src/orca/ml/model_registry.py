@@ -5,13 +5,15 @@ for XGBoost models with calibration and feature specifications.
 """
 
 import hashlib
-import json
 import os
+from collections.abc import Iterator, Sequence
+from itertools import chain
 from pathlib import Path
 from typing import Any
 
 import joblib
 import numpy as np
+import orjson
 import xgboost as xgb
 
 
@@ -30,8 +32,16 @@ class ModelRegistry:
         self.scaler: Any | None = None
         self.feature_spec: dict[str, Any] | None = None
         self.metadata: dict[str, Any] | None = None
+        self.model_sha256: str | None = None
         self.is_loaded = False
 
+        # Per-model lookup structures, rebuilt by load_model
+        self._feature_names: tuple[str, ...] = ()
+        self._feature_defaults: tuple[float, ...] = ()
+        self._ap2_paths: dict[str, str] = {}
+        self._shap_explainer: Any | None = None
+        self._model_meta: dict[str, Any] = {}
+
         # Set deterministic random states
         self._set_deterministic_seeds()
 
@@ -78,18 +88,20 @@ class ModelRegistry:
             self.model = xgb.Booster()
             self.model.load_model(str(model_path / "model.json"))
 
+            # Hash the model file once; predictions report it in their metadata
+            with open(model_path / "model.json", "rb") as f:
+                self.model_sha256 = hashlib.file_digest(f, "sha256").hexdigest()[:16]
+
             # Load calibrator
             self.calibrator = joblib.load(model_path / "calibrator.pkl")
 
             # Load feature specification
-            with open(model_path / "feature_spec.json") as f:
-                self.feature_spec = json.load(f)
+            self.feature_spec = orjson.loads((model_path / "feature_spec.json").read_bytes())
 
             # Load metadata if available
             metadata_path = model_path / "metadata.json"
             if metadata_path.exists():
-                with open(metadata_path) as f:
-                    self.metadata = json.load(f)
+                self.metadata = orjson.loads(metadata_path.read_bytes())
             else:
                 self.metadata = {"version": version}
 
@@ -98,6 +110,7 @@ class ModelRegistry:
             if scaler_path.exists():
                 self.scaler = joblib.load(scaler_path)
 
+            self._prepare_inference()
             self.is_loaded = True
 
             print(f"✅ Model {version} loaded successfully")
@@ -114,36 +127,67 @@ class ModelRegistry:
             self.is_loaded = False
             return False
 
-    def _get_latest_version(self) -> str | None:
-        """Get the latest model version."""
-        if not self.model_dir.exists():
-            return None
+    def _prepare_inference(self) -> None:
+        """Precompute lookup structures used on every prediction for the loaded model."""
+        feature_spec = self.feature_spec or {}
+        feature_names = feature_spec.get("feature_names", [])
+        defaults = feature_spec.get("defaults", {})
+        ap2_mappings = feature_spec.get("ap2_mappings", {})
 
-        versions = []
-        for item in self.model_dir.iterdir():
-            if item.is_dir() and (item / "model.json").exists():
-                versions.append(item.name)
+        self._feature_names = tuple(feature_names)
+        self._feature_defaults = tuple(float(defaults.get(name, 0.0)) for name in feature_names)
 
-        if not versions:
-            return None
+        # AP2 path for every model feature, with the generic path for unmapped ones
+        self._ap2_paths = {name: f"feature.{name}" for name in feature_names}
+        self._ap2_paths.update(ap2_mappings)
 
-        # Sort versions (assuming semantic versioning)
-        versions.sort(reverse=True)
-        return versions[0]
+        # SHAP explainer is built on first use for the newly loaded model
+        self._shap_explainer = None
 
-    def _get_model_hash(self) -> str:
-        """Get SHA256 hash of the model file."""
-        if not self.model or not self.metadata:
-            return "unknown"
+        # Model metadata reported with every prediction; fixed until the next load
+        metadata = self.metadata or {}
+        self._model_meta = {
+            "model_version": metadata.get("version", "unknown"),
+            "model_sha256": self._get_model_hash(),
+            "trained_on": metadata.get("trained_on", "unknown"),
+            "thresholds": metadata.get("thresholds", {}),
+            "feature_count": len(feature_names),
+        }
+
+        # Feature vectors are always in feature spec order, so the scaler can take
+        # plain arrays instead of a DataFrame per call once its column names are checked
+        scaler_names = getattr(self.scaler, "feature_names_in_", None)
+        if scaler_names is not None:
+            if tuple(scaler_names) != self._feature_names:
+                raise ValueError(
+                    "Scaler feature names do not match the feature specification: "
+                    f"{list(scaler_names)} != {list(self._feature_names)}"
+                )
+            self.scaler.feature_names_in_ = None
 
-        version = self.metadata.get("version", "unknown")
-        model_path = self.model_dir / version / "model.json"
+    def _get_latest_version(self) -> str | None:
+        """Get the latest model version."""
+        # Highest version name (assuming semantic versioning)
+        return max(self._iter_versions(), default=None)
 
-        if not model_path.exists():
+    def _iter_versions(self) -> Iterator[str]:
+        """Yield names of version directories that contain a model artifact."""
+        if not self.model_dir.exists():
+            return
+
+        # DirEntry caches the file type from the directory listing, so only
+        # the model.json probe costs a stat per entry
+        with os.scandir(self.model_dir) as entries:
+            for entry in entries:
+                if entry.is_dir() and os.path.exists(os.path.join(entry.path, "model.json")):
+                    yield entry.name
+
+    def _get_model_hash(self) -> str:
+        """Get SHA256 hash of the model file, computed when the model was loaded."""
+        if not self.model:
             return "unknown"
 
-        with open(model_path, "rb") as f:
-            return hashlib.sha256(f.read()).hexdigest()[:16]
+        return self.model_sha256 or "unknown"
 
     def predict_risk(self, features: dict[str, float], enable_shap: bool = False) -> dict[str, Any]:
         """Predict risk score with calibration and feature analysis.
@@ -159,70 +203,68 @@ class ModelRegistry:
                 - model_meta: Model metadata including version and thresholds
                 - shap_values: SHAP values if enabled
         """
+        return self.predict_risk_batch([features], enable_shap=enable_shap)[0]
+
+    def predict_risk_batch(
+        self, features_list: list[dict[str, float]], enable_shap: bool = False
+    ) -> list[dict[str, Any]]:
+        """Predict risk scores for many feature dictionaries at once.
+
+        The rows are stacked into one array so the scaler, XGBoost and the
+        calibrator are each called once for the whole batch.
+
+        Args:
+            features_list: Feature dictionaries from AP2 contracts
+            enable_shap: Whether to compute SHAP values
+
+        Returns:
+            One prediction dictionary per input, in input order, as returned
+            by predict_risk
+        """
         if not self.is_loaded:
             raise ValueError("Model not loaded. Call load_model() first.")
 
-        # Convert features to model input
-        feature_vector = self._features_to_vector(features)
+        if not features_list:
+            return []
 
-        # Store raw features for calibration
-        raw_feature_vector = feature_vector.copy()
+        # Convert features to model input; raw features are kept for calibration
+        raw_batch = self._features_to_matrix(features_list)
 
         # Apply scaling if available
+        feature_batch = raw_batch
         if self.scaler is not None:
-            # Convert to DataFrame with feature names for proper scaling
-            import pandas as pd
-
-            feature_names = self.feature_spec.get("feature_names", []) if self.feature_spec else []
-            if feature_names:
-                feature_df = pd.DataFrame(feature_vector.reshape(1, -1), columns=feature_names)
-                feature_vector = self.scaler.transform(feature_df)
-            else:
-                feature_vector = self.scaler.transform(feature_vector.reshape(1, -1))
+            feature_batch = self.scaler.transform(raw_batch)
 
-        # Get raw prediction (use scaled features for XGBoost)
+        # Get raw predictions (use scaled features for XGBoost); inplace_predict
+        # reads the array directly instead of copying it into a DMatrix
         if self.model is not None:
-            dmatrix = xgb.DMatrix(feature_vector)
-            raw_score = self.model.predict(dmatrix)[0]
+            raw_scores = self.model.inplace_predict(feature_batch)
         else:
-            raw_score = 0.5  # Default fallback
+            raw_scores = np.full(len(features_list), 0.5)  # Default fallback
 
         # Apply calibration (use raw features, not scaled)
         if self.calibrator is not None:
-            calibrated_score = self.calibrator.predict_proba(raw_feature_vector.reshape(1, -1))[
-                0, 1
-            ]
+            calibrated_scores = self.calibrator.predict_proba(raw_batch)[:, 1]
         else:
-            calibrated_score = raw_score  # Fallback to raw score
-
-        # Get key signals (top contributing features)
-        key_signals = self._get_key_signals(features, calibrated_score)
-
-        # Compute SHAP values if enabled (use original unscaled features)
-        shap_values = None
-        if enable_shap and os.getenv("ORCA_ENABLE_SHAP", "false").lower() == "true":
-            # Use original unscaled features for SHAP
-            original_features = self._features_to_vector(features)
-            shap_values = self._compute_shap_values(original_features)
+            calibrated_scores = raw_scores  # Fallback to raw scores
+
+        results = []
+        for i, features in enumerate(features_list):
+            calibrated_score = calibrated_scores[i]
+
+            # Compute SHAP values if enabled (use original unscaled features)
+            shap_values = self._compute_shap_values(raw_batch[i]) if enable_shap else None
+
+            results.append(
+                {
+                    "risk_score": float(calibrated_score),
+                    "key_signals": self._get_key_signals(features, calibrated_score),
+                    "model_meta": dict(self._model_meta),
+                    "shap_values": shap_values,
+                }
+            )
 
-        return {
-            "risk_score": float(calibrated_score),
-            "key_signals": key_signals,
-            "model_meta": {
-                "model_version": (
-                    self.metadata.get("version", "unknown") if self.metadata else "unknown"
-                ),
-                "model_sha256": self._get_model_hash(),
-                "trained_on": (
-                    self.metadata.get("trained_on", "unknown") if self.metadata else "unknown"
-                ),
-                "thresholds": self.metadata.get("thresholds", {}) if self.metadata else {},
-                "feature_count": (
-                    len(self.feature_spec.get("feature_names", [])) if self.feature_spec else 0
-                ),
-            },
-            "shap_values": shap_values,
-        }
+        return results
 
     def _features_to_vector(self, features: dict[str, float]) -> np.ndarray:
         """Convert features dictionary to numpy array in correct order.
@@ -233,31 +275,38 @@ class ModelRegistry:
         Returns:
             Feature vector in the order expected by the model
         """
-        if not self.feature_spec:
-            raise ValueError("Feature specification not loaded")
+        return self._features_to_matrix([features])[0]
 
-        feature_names = self.feature_spec.get("feature_names", [])
-        if not feature_names:
-            raise ValueError("Feature specification not loaded")
+    def _features_to_matrix(self, features_list: list[dict[str, float]]) -> np.ndarray:
+        """Convert feature dictionaries to one array, a row per dictionary in model order.
 
-        # Check for feature drift
-        self._check_feature_drift(features, feature_names)
+        Args:
+            features_list: Feature dictionaries
 
-        # Create feature vector in correct order
-        feature_vector = []
-        for feature_name in feature_names:
-            if feature_name in features:
-                feature_vector.append(float(features[feature_name]))
-            else:
-                # Use default value from feature spec
-                defaults = self.feature_spec.get("defaults", {})
-                default_value = defaults.get(feature_name, 0.0)
-                feature_vector.append(float(default_value))
+        Returns:
+            Feature matrix of shape (len(features_list), feature count)
+        """
+        if not self.feature_spec or not self._feature_names:
+            raise ValueError("Feature specification not loaded")
+
+        feature_names = self._feature_names
+        defaults = self._feature_defaults
 
-        return np.array(feature_vector)
+        # Check for feature drift
+        for features in features_list:
+            self._check_feature_drift(features, feature_names)
+
+        # Gather every row straight into one array in model order, falling back
+        # to the feature spec defaults
+        values = chain.from_iterable(
+            map(features.get, feature_names, defaults) for features in features_list
+        )
+        return np.fromiter(
+            values, dtype=np.float64, count=len(features_list) * len(feature_names)
+        ).reshape(len(features_list), len(feature_names))
 
     def _check_feature_drift(
-        self, features: dict[str, float], expected_features: list[str]
+        self, features: dict[str, float], expected_features: Sequence[str]
     ) -> None:
         """Check for feature drift and fail if detected.
 
@@ -299,31 +348,32 @@ class ModelRegistry:
         feature_importance = self.metadata.get("feature_importance", {}) if self.metadata else {}
 
         # Map features to AP2 paths
-        ap2_mappings = self.feature_spec.get("ap2_mappings", {}) if self.feature_spec else {}
-
-        # Calculate contributions
-        contributions = []
-        for feature_name, value in features.items():
-            if feature_name in feature_importance:
-                importance = feature_importance[feature_name]
-                contribution = value * importance * risk_score
-
-                # Get AP2 path mapping
-                ap2_path = ap2_mappings.get(feature_name, f"feature.{feature_name}")
-
-                contributions.append(
-                    {
-                        "feature_name": feature_name,
-                        "ap2_path": ap2_path,
-                        "value": float(value),
-                        "importance": float(importance),
-                        "contribution": float(contribution),
-                    }
-                )
+        ap2_paths = self._ap2_paths
+
+        # Score every feature, then build signal dicts only for the top 5
+        scored = [
+            (feature_name, value, feature_importance[feature_name])
+            for feature_name, value in features.items()
+            if feature_name in feature_importance
+        ]
+        risk_score = float(risk_score)
+        contributions = [value * importance * risk_score for _, value, importance in scored]
+        top = sorted(range(len(scored)), key=contributions.__getitem__, reverse=True)[:5]
+
+        key_signals = []
+        for i in top:
+            feature_name, value, importance = scored[i]
+            key_signals.append(
+                {
+                    "feature_name": feature_name,
+                    "ap2_path": ap2_paths.get(feature_name, f"feature.{feature_name}"),
+                    "value": float(value),
+                    "importance": float(importance),
+                    "contribution": float(contributions[i]),
+                }
+            )
 
-        # Sort by contribution and return top 5
-        contributions.sort(key=lambda x: x["contribution"], reverse=True)
-        return contributions[:5]
+        return key_signals
 
     def _compute_shap_values(self, feature_vector: np.ndarray) -> dict[str, Any] | None:
         """Compute SHAP values for feature explanation.
@@ -335,10 +385,12 @@ class ModelRegistry:
             SHAP values dictionary or None if SHAP not available
         """
         try:
-            import shap
+            # Create SHAP explainer once per loaded model; building it walks every tree
+            explainer = self._shap_explainer
+            if explainer is None:
+                import shap
 
-            # Create SHAP explainer
-            explainer = shap.TreeExplainer(self.model)
+                explainer = self._shap_explainer = shap.TreeExplainer(self.model)
 
             # Compute SHAP values (ensure 2D input)
             if feature_vector.ndim == 1:
@@ -346,20 +398,13 @@ class ModelRegistry:
             shap_values = explainer.shap_values(feature_vector)
 
             # Map to feature names
-            if self.feature_spec:
-                feature_names = self.feature_spec.get("feature_names", [])
-                ap2_mappings = self.feature_spec.get("ap2_mappings", {})
-            else:
-                feature_names = []
-                ap2_mappings = {}
-
+            ap2_paths = self._ap2_paths
             shap_explanations = []
-            for feature_name, shap_value in zip(feature_names, shap_values[0], strict=False):
-                ap2_path = ap2_mappings.get(feature_name, f"feature.{feature_name}")
+            for feature_name, shap_value in zip(self._feature_names, shap_values[0], strict=False):
                 shap_explanations.append(
                     {
                         "feature_name": feature_name,
-                        "ap2_path": ap2_path,
+                        "ap2_path": ap2_paths[feature_name],
                         "shap_value": float(shap_value),
                     }
                 )
@@ -417,15 +462,7 @@ class ModelRegistry:
         Returns:
             List of available model versions
         """
-        if not self.model_dir.exists():
-            return []
-
-        versions = []
-        for item in self.model_dir.iterdir():
-            if item.is_dir() and (item / "model.json").exists():
-                versions.append(item.name)
-
-        return sorted(versions, reverse=True)
+        return sorted(self._iter_versions(), reverse=True)
 
 
 # Global model registry instance
@@ -9,8 +9,11 @@ from typing import Any
 
 from .model_registry import get_model_registry, load_model
 
+# ORCA_ENABLE_SHAP, resolved on first prediction; see _shap_enabled
+_SHAP_ENABLED: bool | None = None
 
-def predict_risk(features: dict[str, float]) -> dict[str, Any]:
+
+def predict_risk(features: dict[str, float], enable_shap: bool | None = None) -> dict[str, Any]:
     """
     Predict risk score using real XGBoost model with calibration.
 
@@ -19,6 +22,7 @@ def predict_risk(features: dict[str, float]) -> dict[str, Any]:
 
     Args:
         features: Dictionary of feature values extracted from AP2 contract
+        enable_shap: Whether to compute SHAP values (default: ORCA_ENABLE_SHAP)
 
     Returns:
         Dictionary containing:
@@ -29,6 +33,27 @@ def predict_risk(features: dict[str, float]) -> dict[str, Any]:
             - version: Model version identifier
             - model_type: "xgboost" (real model)
     """
+    return predict_risk_batch([features], enable_shap=enable_shap)[0]
+
+
+def predict_risk_batch(
+    features_list: list[dict[str, float]], enable_shap: bool | None = None
+) -> list[dict[str, Any]]:
+    """
+    Predict risk scores for many feature dictionaries with one model call.
+
+    Bulk scoring paths (backtests, replays, evaluation) should use this
+    instead of calling predict_risk in a loop: the rows are scored together
+    so the scaler, XGBoost and the calibrator run once per batch.
+
+    Args:
+        features_list: Feature dictionaries extracted from AP2 contracts
+        enable_shap: Whether to compute SHAP values (default: ORCA_ENABLE_SHAP)
+
+    Returns:
+        One result per input, in input order, shaped like predict_risk's.
+        Inputs the real model cannot score fall back to the stub individually.
+    """
     # Get model registry
     registry = get_model_registry()
 
@@ -37,24 +62,48 @@ def predict_risk(features: dict[str, float]) -> dict[str, Any]:
         success = load_model()
         if not success:
             # Fallback to stub if model loading fails
-            return _fallback_to_stub(features)
+            return [_fallback_to_stub(features) for features in features_list]
 
     try:
         # Check if SHAP is enabled
-        enable_shap = os.getenv("ORCA_ENABLE_SHAP", "false").lower() == "true"
+        if enable_shap is None:
+            enable_shap = _shap_enabled()
 
         # Predict using real model
-        result = registry.predict_risk(features, enable_shap=enable_shap)
+        results = registry.predict_risk_batch(features_list, enable_shap=enable_shap)
+
+    except Exception as e:
+        if len(features_list) > 1:
+            # Score rows one at a time so only the failing ones use the stub
+            return [predict_risk(features, enable_shap) for features in features_list]
 
+        print(f"⚠️ Real model prediction failed: {e}")
+        return [_fallback_to_stub(features) for features in features_list]
+
+    for result in results:
         # Add version and model type for compatibility
         result["version"] = result["model_meta"]["model_version"]
         result["model_type"] = "xgboost"
 
-        return result
+    return results
+
+
+def _shap_enabled() -> bool:
+    """Check whether ORCA_ENABLE_SHAP enables SHAP, reading the environment once.
+
+    Returns:
+        True if SHAP explanations should be computed
+    """
+    global _SHAP_ENABLED
+    if _SHAP_ENABLED is None:
+        _SHAP_ENABLED = os.environ.get("ORCA_ENABLE_SHAP", "false").lower() == "true"
+    return _SHAP_ENABLED
 
-    except Exception as e:
-        print(f"⚠️ Real model prediction failed: {e}")
-        return _fallback_to_stub(features)
+
+def invalidate_shap_cache() -> None:
+    """Re-read ORCA_ENABLE_SHAP on the next prediction, e.g. after changing it in tests."""
+    global _SHAP_ENABLED
+    _SHAP_ENABLED = None
 
 
 def _fallback_to_stub(features: dict[str, float]) -> dict[str, Any]:
@@ -217,13 +266,4 @@ def predict_with_shap(features: dict[str, float]) -> dict[str, Any]:
     Returns:
         Risk prediction results with SHAP values
     """
-    # Temporarily enable SHAP
-    original_shap_setting = os.environ.get("ORCA_ENABLE_SHAP", "false")
-    os.environ["ORCA_ENABLE_SHAP"] = "true"
-
-    try:
-        result = predict_risk(features)
-        return result
-    finally:
-        # Restore original setting
-        os.environ["ORCA_ENABLE_SHAP"] = original_shap_setting
+    return predict_risk(features, enable_shap=True)
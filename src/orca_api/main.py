@@ -108,7 +108,7 @@ async def health() -> HealthResponse:
 
 
 @app.get("/readyz", response_model=ReadinessResponse)
-async def readiness_check() -> ReadinessResponse:
+def readiness_check() -> ReadinessResponse:
     """
     Readiness check endpoint for Kubernetes readiness probe.
 
@@ -194,8 +194,10 @@ async def readiness_check() -> ReadinessResponse:
     )
 
 
+# Blocking handlers (rules, model and explanation work) are plain functions so
+# Starlette runs them in its threadpool instead of on the event loop
 @app.post("/decision", response_model=DecisionResponse)
-async def make_decision(request: DecisionRequest) -> DecisionResponse:
+def make_decision(request: DecisionRequest) -> DecisionResponse:
     """
     Evaluate a decision request using the Orca Core engine.
 
@@ -226,7 +228,7 @@ async def make_decision(request: DecisionRequest) -> DecisionResponse:
 
 
 @app.post("/explain", response_model=ExplainResponse)
-async def explain_decision(request: ExplainRequest) -> ExplainResponse:
+def explain_decision(request: ExplainRequest) -> ExplainResponse:
     """
     Generate a plain-English explanation for a decision.
 
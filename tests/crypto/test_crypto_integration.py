@@ -1,10 +1,16 @@
 """Tests for Orca Core crypto integration."""
 
+import copy
 import json
+import logging
 import os
 from datetime import UTC, datetime
 from decimal import Decimal
 from pathlib import Path
+from uuid import UUID
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519
 
 from src.orca.core.decision_contract import (
     AP2DecisionContract,
@@ -62,6 +68,53 @@ class TestKeyManager:
         assert len(fingerprint) > 0
         assert isinstance(fingerprint, str)
 
+    def test_key_fingerprint_from_env_keys(self, monkeypatch):
+        """Test the fingerprint of a fixed key loaded from the environment."""
+        private_key = ed25519.Ed25519PrivateKey.from_private_bytes(bytes(32))
+        private_pem = private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+        public_pem = private_key.public_key().public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        monkeypatch.setenv("ORCA_PRIVATE_KEY", private_pem.decode("utf-8"))
+        monkeypatch.setenv("ORCA_PUBLIC_KEY", public_pem.decode("utf-8"))
+
+        key_manager = KeyManager()
+        assert key_manager.load_keys_from_env()
+
+        assert key_manager.get_public_key() == public_pem
+        assert (
+            key_manager.get_public_key_fingerprint()
+            == "M54v+RdjBQe2pCO1zghOKF0fpl2Ts+J6YZXTu+vJriM="
+        )
+
+        # Parsed keys and the fingerprint are reused until keys are reloaded
+        public_key = key_manager.get_public_key_object()
+        assert public_key is key_manager.get_public_key_object()
+        assert key_manager.get_private_key_object().public_key() == public_key
+        assert key_manager.load_test_keys()
+        assert key_manager.get_public_key_object() is not public_key
+        assert key_manager.get_public_key_fingerprint() != (
+            "M54v+RdjBQe2pCO1zghOKF0fpl2Ts+J6YZXTu+vJriM="
+        )
+
+    def test_verification_method_follows_loaded_key(self):
+        """Test the cached verification method is rebuilt when keys are reloaded."""
+        key_manager = KeyManager()
+        assert key_manager.get_verification_method() is None
+
+        key_manager.load_test_keys()
+        method = key_manager.get_verification_method()
+        assert method == f"orca-test-key#{key_manager.get_public_key_fingerprint()}"
+        assert key_manager.get_verification_method() is method
+
+        key_manager.load_test_keys()
+        assert key_manager.get_verification_method() is not method
+
     def test_deterministic_test_keypair(self):
         """Test deterministic test keypair generation."""
         private_key1, public_key1 = get_test_keypair()
@@ -219,6 +272,115 @@ class TestVCSigner:
         is_valid = signer.verify_signature(decision_data, proof)
         assert is_valid
 
+    def test_sign_and_verify_parse_each_key_once(self, monkeypatch):
+        """Test that repeated signing and verification reuse the parsed keys."""
+        import src.orca.crypto.keys as keys_module
+
+        private_pem, public_pem = get_test_keypair()
+        monkeypatch.setenv("ORCA_PRIVATE_KEY", private_pem.decode("utf-8"))
+        monkeypatch.setenv("ORCA_PUBLIC_KEY", public_pem.decode("utf-8"))
+        key_manager = KeyManager()
+        assert key_manager.load_keys_from_env()
+
+        parses = []
+        load_private = keys_module.serialization.load_pem_private_key
+        load_public = keys_module.serialization.load_pem_public_key
+        monkeypatch.setattr(
+            keys_module.serialization,
+            "load_pem_private_key",
+            lambda *args, **kwargs: parses.append("private") or load_private(*args, **kwargs),
+        )
+        monkeypatch.setattr(
+            keys_module.serialization,
+            "load_pem_public_key",
+            lambda *args, **kwargs: parses.append("public") or load_public(*args, **kwargs),
+        )
+
+        signer = VCSigner()
+        signer.key_manager = key_manager
+        for _ in range(3):
+            proof = signer.sign_decision({"decision": {"result": "APPROVE"}})
+            assert signer.verify_signature({}, proof)
+
+        assert sorted(parses) == ["private", "public"]
+
+    def test_verify_signatures_batch(self):
+        """Test batch verification reports each proof separately."""
+        signer = VCSigner()
+        good = signer.sign_decision({"decision": {"result": "APPROVE"}})
+        tampered = dict(good, created="2000-01-01T00:00:00+00:00")
+        unsigned = dict(good, proofValue="")
+        bad_base64 = dict(good, proofValue="not base64!")
+        malformed = "not a proof"
+
+        results = signer.verify_signatures_batch(
+            [({}, good), ({}, tampered), ({}, unsigned), ({}, bad_base64), ({}, malformed)]
+        )
+
+        assert results == [True, False, False, False, False]
+        assert signer.verify_signatures_batch([]) == []
+
+    def test_sign_decisions_bulk(self):
+        """Test bulk signing returns a verifiable proof per decision, in order."""
+        signer = VCSigner()
+        decisions = [{"decision": {"result": "APPROVE", "index": i}} for i in range(5)]
+
+        for max_workers in (1, 3):
+            proofs = signer.sign_decisions_bulk(decisions, max_workers=max_workers)
+            pairs = list(zip(decisions, proofs, strict=True))
+            assert signer.verify_signatures_batch(pairs) == [True] * len(decisions)
+
+        assert signer.sign_decisions_bulk([]) == []
+        signer.key_manager = KeyManager()
+        assert signer.sign_decisions_bulk(decisions) == [None] * len(decisions)
+
+    def test_signing_failures_are_logged(self, caplog):
+        """Test that signing and verification problems go to the module logger."""
+        signer = VCSigner()
+        proof = signer.sign_decision({"decision": {"result": "APPROVE"}})
+
+        with caplog.at_level(logging.WARNING, logger="src.orca.crypto.signing"):
+            assert not signer.verify_signature({}, dict(proof, created="tampered"))
+            signer.key_manager = KeyManager()
+            assert signer.sign_decision({"decision": {"result": "APPROVE"}}) is None
+
+        messages = [record.getMessage() for record in caplog.records]
+        assert messages[0].startswith("Signature verification failed")
+        assert messages[1] == "Keys not loaded, cannot sign decision"
+
+    def test_canonical_json_matches_json_dumps(self):
+        """Test canonical proof JSON matches sorted compact json.dumps output."""
+        signer = VCSigner()
+        proofs = [
+            signer.sign_decision({"decision": {"result": "APPROVE"}}),
+            {
+                "type": "Ed25519Signature2020",
+                "created": "2024-01-01T00:00:00+00:00",
+                "verificationMethod": 'did:example:"café"#key-1\n',
+                "proofPurpose": "assertionMethod",
+            },
+            {
+                "type": "Ed25519Signature2020",
+                "created": "2024-01-01T00:00:00+00:00",
+                "verificationMethod": "did:example:123#key-1",
+                "proofPurpose": "assertionMethod",
+                "domain": "orca",
+                "proofValue": "abc",
+            },
+            {
+                "type": "Ed25519Signature2020",
+                "created": 1704067200,
+                "verificationMethod": "did:example:123#key-1",
+                "proofPurpose": "assertionMethod",
+            },
+        ]
+
+        for proof in proofs:
+            expected = {k: v for k, v in proof.items() if k != "proofValue"}
+            assert signer._create_canonical_json(proof) == json.dumps(
+                expected, sort_keys=True, separators=(",", ":")
+            )
+
     def test_global_sign_decision(self):
         """Test global sign_decision function."""
         decision_data = {
@@ -503,6 +665,10 @@ class TestReceiptHasher:
         is_valid = hasher.verify_receipt(decision_data, wrong_hash)
         assert not is_valid
 
+        # Malformed hashes are rejected without recomputing the receipt
+        assert not hasher.verify_receipt(decision_data, receipt_hash[:-1])
+        assert not hasher.verify_receipt(decision_data, None)
+
     def test_global_make_receipt(self):
         """Test global make_receipt function."""
         decision_data = {
@@ -552,6 +718,80 @@ class TestReceiptHasher:
         assert receipt_hash is not None
         assert len(receipt_hash) == 64
 
+    def test_receipt_hash_is_stable_and_input_unchanged(self):
+        """Test the receipt hash for model_dump-style values and that input is not mutated."""
+        decision_data = {
+            "ap2_version": "0.1.0",
+            "intent": {
+                "actor": "human",
+                "intent_type": "purchase",
+                "channel": "web",
+                "agent_presence": "assisted",
+                "timestamps": {
+                    "created": datetime(2025, 1, 1, tzinfo=UTC),
+                    "expires": datetime(2025, 1, 1, 1, tzinfo=UTC),
+                },
+                "nonce": UUID("12345678-1234-5678-1234-567812345678"),
+            },
+            "cart": {
+                "items": [
+                    {
+                        "id": "item1",
+                        "name": "Café crème",
+                        "quantity": 2,
+                        "unit_price": Decimal("50.00"),
+                        "total_price": Decimal("100.00"),
+                    }
+                ],
+                "amount": Decimal("100.00"),
+                "currency": "EUR",
+                "geo": {"country": "FR", "city": "Zürich"},
+            },
+            "payment": {
+                "instrument_ref": "card_123456789",
+                "modality": "immediate",
+                "auth_requirements": ["pin"],
+            },
+            "decision": {
+                "result": "APPROVE",
+                "risk_score": 1e-05,
+                "reasons": [],
+                "actions": [],
+                "meta": {
+                    "model": "rules_only",
+                    "trace_id": "test-trace-123",
+                    "version": "0.1.0",
+                    "processing_time_ms": 1.5,
+                },
+            },
+            "signing": {"receipt_hash": None},
+            "metadata": {"sensitive": "x"},
+        }
+        original = copy.deepcopy(decision_data)
+
+        receipt_hash = make_receipt(decision_data)
+
+        # Pinned so changes to receipt encoding cannot silently invalidate old receipts
+        assert receipt_hash == "406ff6415185b2ae7e764e13b9c3e571acdf396bdc792291f0e2596713b74951"
+        assert decision_data == original
+
+    def test_receipt_non_str_keys_hash_as_json_strings(self):
+        """Test that non-string dict keys hash the same as their JSON string form."""
+        decision_data = {
+            "ap2_version": "0.1.0",
+            "cart": {"amount": "10.00", "geo": {1: "a", "b": 2, None: 3, False: 4}},
+            "decision": {"result": "APPROVE", "scores": {10: 0.1, 2: 0.2}},
+        }
+        stringified = {
+            "ap2_version": "0.1.0",
+            "cart": {"amount": "10.00", "geo": {"1": "a", "b": 2, "null": 3, "false": 4}},
+            "decision": {"result": "APPROVE", "scores": {"10": 0.1, "2": 0.2}},
+        }
+        original = copy.deepcopy(decision_data)
+
+        assert make_receipt(decision_data) == make_receipt(stringified)
+        assert decision_data == original
+
 
 class TestDecisionContractIntegration:
     """Test decision contract integration with crypto."""
@@ -473,6 +473,46 @@ class TestAP2NLGGuardrails:
         for field in expected_fields:
             assert field in self.explainer.field_guardrails, f"Missing field in guardrails: {field}"
 
+        # Guardrails are a shared, immutable set
+        assert isinstance(self.explainer.field_guardrails, frozenset)
+        assert self.explainer.field_guardrails is AP2NLGExplainer().field_guardrails
+
+    def test_citations_use_contract_values(self):
+        """Test reason and action citations are formatted from the contract."""
+        contract = self.create_test_ap2_contract(result="DECLINE", risk_score=0.9, amount=250.0)
+
+        assert self.explainer._get_ap2_citations_for_reason("high_ticket", contract) == [
+            "CartMandate.amount=250.0",
+            "CartMandate.currency=USD",
+        ]
+        assert self.explainer._get_ap2_citations_for_action("step_up_auth", contract) == [
+            "PaymentMandate.auth_requirements=['pin']",
+            "IntentMandate.channel=web",
+        ]
+        assert self.explainer._get_ap2_citations_for_action("unknown", contract) == []
+
+        contract.cart = contract.cart.model_copy(update={"geo": None})
+        assert self.explainer._get_ap2_citations_for_reason("location_mismatch", contract) == [
+            "CartMandate.geo.country=unknown",
+            "IntentMandate.channel=web",
+        ]
+
+    def test_citation_tables_are_guardrailed(self):
+        """Test every precomputed citation field passes guardrail validation."""
+        from src.orca.explain.nlg import (
+            _ACTION_CITATION_FIELDS,
+            _REASON_CITATION_FIELDS,
+            _citation_values,
+        )
+
+        citation_values = _citation_values(self.create_test_ap2_contract())
+        for table in (_REASON_CITATION_FIELDS, _ACTION_CITATION_FIELDS):
+            for fields in table.values():
+                assert fields
+                for field_path in fields:
+                    assert self.explainer._validate_field_citation(f"{field_path}=x")
+                    assert field_path in citation_values
+
     def test_citation_filtering(self):
         """Test that invalid citations are filtered out."""
         # Test the validation function directly
@@ -512,6 +552,9 @@ class TestAP2NLGGlobalFunctions:
         assert "Decision: APPROVE" in explanation
         assert "AP2 context:" in explanation
 
+        explanation = explain_ap2_decision(contract, include_context=False)
+        assert explanation == "Decision: APPROVE. Risk score: 0.100."
+
     def test_explain_legacy_decision_global(self):
         """Test global explain_legacy_decision function."""
         from src.orca.explain.nlg import explain_legacy_decision
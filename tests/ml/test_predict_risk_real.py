@@ -1,17 +1,24 @@
 """Tests for real ML risk prediction system."""
 
+import hashlib
 import json
 import os
+import shutil
 from pathlib import Path
 
+import joblib
+import numpy as np
 import pytest
+import xgboost as xgb
 
 from src.orca.ml.model_registry import ModelRegistry
 from src.orca.ml.predict_risk import (
     get_feature_spec,
     get_model_info,
+    invalidate_shap_cache,
     load_model_version,
     predict_risk,
+    predict_risk_batch,
     predict_with_shap,
 )
 
@@ -167,6 +174,19 @@ class TestRealMLPrediction:
         assert "risk_score" in result
         assert result["model_type"] == "xgboost"  # Should use real model
 
+    def test_predict_risk_batch_falls_back_per_row(self):
+        """Test batch prediction, with drifting rows falling back to the stub alone."""
+        if not load_model_version("1.0.0"):
+            pytest.skip("Model not available")
+
+        features = {name: 1.0 for name in get_feature_spec()["feature_names"]}
+        features_list = [features, {"amount": 900.0}, dict(features, amount=900.0)]
+
+        results = predict_risk_batch(features_list)
+        assert [r["model_type"] for r in results] == ["xgboost", "stub", "xgboost"]
+        assert results == [predict_risk(f) for f in features_list]
+        assert predict_risk_batch([]) == []
+
     def test_thresholding_parity(self):
         """Test thresholding parity between rules-only and rules+AI."""
         # Load model
@@ -233,6 +253,7 @@ class TestRealMLPrediction:
 
         # Test without SHAP
         os.environ.pop("ORCA_ENABLE_SHAP", None)
+        invalidate_shap_cache()
         result_no_shap = predict_risk(features)
         assert result_no_shap["shap_values"] is None
 
@@ -245,6 +266,36 @@ class TestRealMLPrediction:
             assert "base_value" in result_with_shap["shap_values"]
             assert isinstance(result_with_shap["shap_values"]["explanations"], list)
 
+        # The override ends with the call and never touches the environment
+        assert "ORCA_ENABLE_SHAP" not in os.environ
+        assert predict_risk(features)["shap_values"] is None
+
+    def test_shap_flag_read_once_from_environment(self, monkeypatch):
+        """Test that ORCA_ENABLE_SHAP is cached until the cache is invalidated."""
+        if not load_model_version("1.0.0"):
+            pytest.skip("Model not available")
+
+        features = {name: 1.0 for name in get_feature_spec()["feature_names"]}
+        monkeypatch.setenv("ORCA_ENABLE_SHAP", "TRUE")
+        invalidate_shap_cache()
+        try:
+            assert predict_risk(features)["shap_values"] is not None
+
+            monkeypatch.setenv("ORCA_ENABLE_SHAP", "false")
+            assert predict_risk(features)["shap_values"] is not None
+
+            invalidate_shap_cache()
+            assert predict_risk(features)["shap_values"] is None
+
+            # An explicit argument overrides the environment either way
+            assert predict_risk(features, enable_shap=True)["shap_values"] is not None
+            monkeypatch.setenv("ORCA_ENABLE_SHAP", "true")
+            invalidate_shap_cache()
+            assert predict_risk(features, enable_shap=False)["shap_values"] is None
+        finally:
+            monkeypatch.undo()
+            invalidate_shap_cache()
+
     def test_model_registry_functionality(self):
         """Test model registry functionality."""
         registry = ModelRegistry()
@@ -263,6 +314,141 @@ class TestRealMLPrediction:
         assert info["status"] == "loaded"
         assert info["model_version"] == "1.0.0"
 
+    def test_model_hash_computed_at_load(self):
+        """Test that the model hash is computed once at load time."""
+        registry = ModelRegistry()
+        assert registry._get_model_hash() == "unknown"
+
+        if not registry.load_model("1.0.0"):
+            pytest.skip("Model not available")
+
+        model_bytes = Path("models/xgb/1.0.0/model.json").read_bytes()
+        expected = hashlib.sha256(model_bytes).hexdigest()[:16]
+        assert registry.model_sha256 == expected
+        assert registry.get_model_info()["model_sha256"] == expected
+
+    def test_features_to_vector_follows_feature_spec_order(self):
+        """Test that features are gathered in feature spec order, ignoring extras."""
+        registry = ModelRegistry()
+        if not registry.load_model("1.0.0"):
+            pytest.skip("Model not available")
+
+        feature_names = registry.feature_spec["feature_names"]
+        features = {name: float(i) for i, name in enumerate(reversed(feature_names))}
+        features["extra_feature"] = 999.0
+
+        vector = registry._features_to_vector(features)
+        assert vector.dtype == np.float64
+        assert vector.tolist() == [features[name] for name in feature_names]
+
+        matrix = registry._features_to_matrix([features, dict(features, amount=-1.0)])
+        assert matrix.shape == (2, len(feature_names))
+        assert matrix[0].tolist() == vector.tolist()
+        assert matrix[1, feature_names.index("amount")] == -1.0
+
+    def test_uncalibrated_score_matches_booster_prediction(self):
+        """Test that the uncalibrated score matches a DMatrix prediction."""
+        registry = ModelRegistry()
+        if not registry.load_model("1.0.0"):
+            pytest.skip("Model not available")
+
+        features = {name: 1.0 for name in registry.feature_spec["feature_names"]}
+        features["amount"] = 750.0
+        registry.calibrator = None
+
+        scaled = registry.scaler.transform(registry._features_to_vector(features).reshape(1, -1))
+        expected = registry.model.predict(xgb.DMatrix(scaled))[0]
+
+        result = registry.predict_risk(features)
+        assert result["risk_score"] == float(expected)
+
+    def test_scaler_takes_arrays_in_feature_spec_order(self):
+        """Test that the scaler is checked against the feature spec and fed plain arrays."""
+        registry = ModelRegistry()
+        if not registry.load_model("1.0.0"):
+            pytest.skip("Model not available")
+
+        assert registry.scaler.feature_names_in_ is None
+
+    def test_scaler_feature_name_mismatch_fails_load(self, tmp_path):
+        """Test that a scaler fitted on differently ordered features is rejected."""
+        model_dir = Path("models/xgb/1.0.0")
+        if not model_dir.exists():
+            pytest.skip("Model artifacts not found")
+
+        version_dir = tmp_path / "1.0.0"
+        shutil.copytree(model_dir, version_dir)
+        scaler = joblib.load(version_dir / "scaler.pkl")
+        scaler.feature_names_in_ = scaler.feature_names_in_[::-1]
+        joblib.dump(scaler, version_dir / "scaler.pkl")
+
+        registry = ModelRegistry(str(tmp_path))
+        assert not registry.load_model("1.0.0")
+        assert not registry.is_loaded
+
+    def test_ap2_paths_cover_every_model_feature(self):
+        """Test that every model feature has a precomputed AP2 path."""
+        registry = ModelRegistry()
+        if not registry.load_model("1.0.0"):
+            pytest.skip("Model not available")
+
+        ap2_mappings = registry.feature_spec["ap2_mappings"]
+        for name in registry.feature_spec["feature_names"]:
+            assert registry._ap2_paths[name] == ap2_mappings.get(name, f"feature.{name}")
+
+    def test_shap_explainer_reused_until_reload(self):
+        """Test that the SHAP explainer is built once per loaded model."""
+        pytest.importorskip("shap")
+        registry = ModelRegistry()
+        if not registry.load_model("1.0.0"):
+            pytest.skip("Model not available")
+
+        vector = np.ones(len(registry.feature_spec["feature_names"]))
+        first = registry._compute_shap_values(vector)
+        explainer = registry._shap_explainer
+        assert explainer is not None
+
+        assert registry._compute_shap_values(vector) == first
+        assert registry._shap_explainer is explainer
+
+        assert registry.load_model("1.0.0")
+        assert registry._shap_explainer is None
+
+    def test_key_signals_top_five_by_contribution(self):
+        """Test that key signals keep the top 5 contributions, ties in input order."""
+        registry = ModelRegistry()
+        registry.metadata = {"feature_importance": {f"f{i}": 0.1 * i for i in range(8)}}
+        registry.feature_spec = {"ap2_mappings": {"f7": "cart.amount"}}
+        registry._prepare_inference()
+
+        features = {"unknown": 50.0, **{f"f{i}": 1.0 for i in range(8)}, "f0": 0.0}
+        features["f6"] = 0.0
+        signals = registry._get_key_signals(features, 0.5)
+
+        assert [s["feature_name"] for s in signals] == ["f7", "f5", "f4", "f3", "f2"]
+        assert signals[0]["ap2_path"] == "cart.amount"
+        assert signals[1]["ap2_path"] == "feature.f5"
+        assert signals[0]["contribution"] == pytest.approx(0.35)
+
+        zero_signals = registry._get_key_signals(dict.fromkeys(["f3", "f1", "f2"], 0.0), 0.5)
+        assert [s["feature_name"] for s in zero_signals] == ["f3", "f1", "f2"]
+
+    def test_versions_require_model_artifact(self, tmp_path):
+        """Test that only version directories with a model.json are listed."""
+        for version in ("1.0.0", "1.2.0", "1.1.0"):
+            (tmp_path / version).mkdir()
+            (tmp_path / version / "model.json").write_text("{}")
+        (tmp_path / "2.0.0").mkdir()  # no model artifact
+        (tmp_path / "3.0.0").write_text("not a directory")
+
+        registry = ModelRegistry(str(tmp_path))
+        assert registry.list_versions() == ["1.2.0", "1.1.0", "1.0.0"]
+        assert registry._get_latest_version() == "1.2.0"
+
+        empty = ModelRegistry(str(tmp_path / "missing"))
+        assert empty.list_versions() == []
+        assert empty._get_latest_version() is None
+
     def test_fallback_to_stub(self):
         """Test fallback to stub when model fails."""
         # Create a registry with non-existent model
@@ -358,6 +544,46 @@ class TestRealMLPrediction:
         assert model_meta["feature_count"] == 10
         assert isinstance(model_meta["thresholds"], dict)
 
+    def test_model_meta_matches_model_info_per_prediction(self):
+        """Test that each prediction gets its own copy of the load-time model metadata."""
+        registry = ModelRegistry()
+        if not registry.load_model("1.0.0"):
+            pytest.skip("Model not available")
+
+        features = {name: 1.0 for name in registry.feature_spec["feature_names"]}
+        first = registry.predict_risk(features)["model_meta"]
+        first["model_version"] = "mutated"
+
+        model_meta = registry.predict_risk(features)["model_meta"]
+        info = registry.get_model_info()
+        assert model_meta == {
+            "model_version": info["model_version"],
+            "model_sha256": info["model_sha256"],
+            "trained_on": info["trained_on"],
+            "thresholds": info["thresholds"],
+            "feature_count": info["feature_count"],
+        }
+
+    def test_predict_risk_batch_matches_single_predictions(self):
+        """Test that batch predictions match one-at-a-time predictions, in order."""
+        registry = ModelRegistry()
+        if not registry.load_model("1.0.0"):
+            pytest.skip("Model not available")
+
+        feature_names = registry.feature_spec["feature_names"]
+        features_list = [
+            {name: float(i + j) for j, name in enumerate(feature_names)} for i in range(4)
+        ]
+        for features, amount in zip(features_list, (10.0, 500.0, 1000.0, 5000.0), strict=True):
+            features["amount"] = amount
+
+        batch = registry.predict_risk_batch(features_list)
+        assert batch == [registry.predict_risk(features) for features in features_list]
+        assert registry.predict_risk_batch([]) == []
+
+        with pytest.raises(ValueError, match="Feature drift detected"):
+            registry.predict_risk_batch([features_list[0], {"amount": 1.0}])
+
     def test_key_signals_ap2_mapping(self):
         """Test that key signals are properly mapped to AP2 paths."""
         # Load model
@@ -202,6 +202,54 @@ class TestCartMandateValidation:
         with pytest.raises(ValueError):
             validate_cart(cart_data)
 
+    def test_cart_mandate_currency_outside_known_codes(self):
+        """Test that well-formed codes outside the known ISO list are still accepted."""
+        cart_data = {
+            "items": [
+                {
+                    "id": "item1",
+                    "name": "Test Product",
+                    "quantity": 1,
+                    "unit_price": 10.00,
+                    "total_price": 10.00,
+                }
+            ],
+            "amount": 10.00,
+            "currency": "XTS",
+        }
+
+        assert validate_cart(cart_data).currency == "XTS"
+        assert validate_cart(cart_data | {"currency": "EUR"}).currency == "EUR"
+        with pytest.raises(ValueError):
+            validate_cart(cart_data | {"currency": "X1S"})
+
+    def test_cart_mandate_interns_lookup_codes(self):
+        """Test that currency, MCC and country codes are interned at parse time."""
+        cart_json = json.dumps(
+            {
+                "items": [
+                    {
+                        "id": "item1",
+                        "name": "Test Product",
+                        "quantity": 1,
+                        "unit_price": 10.00,
+                        "total_price": 10.00,
+                    }
+                ],
+                "amount": 10.00,
+                "currency": "USD",
+                "mcc": "5733",
+                "geo": {"country": "US"},
+            }
+        )
+
+        first = cart_from_json(cart_json)
+        second = cart_from_json(cart_json)
+
+        assert first.currency is second.currency
+        assert first.mcc is second.mcc
+        assert first.geo.country is second.geo.country
+
     def test_cart_mandate_empty_items(self):
         """Test that empty items list is rejected."""
         cart_data = {
@@ -257,6 +305,18 @@ class TestPaymentMandateValidation:
         with pytest.raises(ValueError):
             validate_payment(payment_data)
 
+    def test_mandates_are_frozen_and_ignore_unknown_fields(self):
+        """Test that validated mandates are immutable and unknown fields are ignored."""
+        payment = validate_payment({"instrument_ref": "card_123", "modality": "immediate"})
+
+        with pytest.raises(ValueError):
+            payment.instrument_ref = "card_456"
+
+        payment = validate_payment(
+            {"instrument_ref": "card_123", "modality": "immediate", "unexpected": True}
+        )
+        assert "unexpected" not in payment.model_dump()
+
     def test_payment_mandate_invalid_modality(self):
         """Test that invalid modality is rejected."""
         payment_data = {
@@ -333,6 +393,60 @@ class TestJSONSerialization:
         assert restored_payment.modality == original_payment.modality
         assert restored_payment.auth_requirements == original_payment.auth_requirements
 
+    def test_validate_helpers_accept_json_strings(self):
+        """Test JSON string input matches the *_from_json loaders and still validates."""
+        payment_json = json.dumps({"instrument_token": "tok_123", "modality": "deferred"})
+        assert validate_payment(payment_json) == payment_from_json(payment_json)
+
+        with pytest.raises(ValueError):
+            validate_payment(json.dumps({"modality": "deferred"}))
+        with pytest.raises(ValueError):
+            validate_intent("{not json")
+
+    def test_trusted_dicts_round_trip_without_validation(self):
+        """Test trusted model_dump() dicts rebuild equal mandates, nested models included."""
+        now = datetime.now(UTC)
+        intent = IntentMandate(
+            actor="human",
+            intent_type="purchase",
+            channel="web",
+            agent_presence="assisted",
+            timestamps={"created": now, "expires": now + timedelta(hours=1)},
+        )
+        cart = validate_cart(
+            {
+                "items": [
+                    {
+                        "id": "item1",
+                        "name": "Test Product",
+                        "quantity": 2,
+                        "unit_price": "10.50",
+                        "total_price": "21.00",
+                    }
+                ],
+                "amount": "21.00",
+                "currency": "USD",
+                "geo": {"country": "US"},
+            }
+        )
+        payment = validate_payment(
+            {
+                "instrument_ref": "card_123456789",
+                "modality": "immediate",
+                "routing_hints": [{"processor": "stripe", "priority": 1}],
+            }
+        )
+
+        assert validate_intent(intent.model_dump(), trusted=True) == intent
+        assert validate_cart(cart.model_dump(), trusted=True) == cart
+        assert validate_payment(payment.model_dump(), trusted=True) == payment
+
+        # Trusted data is taken as is, while untrusted data is still validated
+        bad_cart = cart.model_dump() | {"amount": Decimal("1.00")}
+        assert validate_cart(bad_cart, trusted=True).amount == Decimal("1.00")
+        with pytest.raises(ValueError):
+            validate_cart(bad_cart)
+
 
 class TestGoldenFileValidation:
     """Test validation against golden files."""
@@ -20,13 +20,22 @@ from src.orca.core.decision_contract import (
     AP2DecisionContract,
     DecisionOutcome,
     create_ap2_decision_contract,
+    create_decision_reason,
 )
 from src.orca.core.feature_extractor import (
     AP2FeatureExtractor,
+    composite_risk_score,
+    extract_features_array,
+    extract_features_batch,
     extract_features_from_ap2,
     extract_features_from_legacy,
 )
-from src.orca.core.rules_engine import AP2RulesEngine, evaluate_ap2_rules
+from src.orca.core.rules_engine import (
+    REQUIRES_GEO,
+    AP2Rule,
+    AP2RulesEngine,
+    evaluate_ap2_rules,
+)
 from src.orca.mandates.ap2_types import (
     ActorType,
     AgentPresence,
@@ -106,6 +115,19 @@ class TestAP2FeatureExtractor:
         assert features["loyalty_score"] == 0.0  # Default value
         assert features["time_since_last_purchase"] == 0.0  # Default value
 
+        # Array API returns the same values in feature_names order
+        vector = extract_features_array(contract)
+        feature_names = AP2FeatureExtractor().feature_names
+        assert vector.shape == (len(feature_names),)
+        assert vector.tolist() == [features[name] for name in feature_names]
+
+        # Batch API stacks one such row per contract
+        batch = extract_features_batch([contract, contract])
+        assert batch.shape == (2, len(feature_names))
+        assert batch[0].tolist() == vector.tolist()
+        assert batch[1].tolist() == vector.tolist()
+        assert extract_features_batch([]).shape == (0, len(feature_names))
+
     def test_extract_features_from_legacy_data(self):
         """Test feature extraction from legacy data."""
         legacy_data = {
@@ -141,6 +163,9 @@ class TestAP2FeatureExtractor:
         assert features["channel_risk"] == 0.2  # Online
         assert features["loyalty_score"] == 0.3  # Gold
         assert features["chargebacks_12m"] == 0.0
+        assert features["customer_age_days"] == 365.0
+        assert features["velocity_7d"] == 3.0  # Default value
+        assert features["velocity_30d"] == 10.0  # Default value
 
     def test_feature_extractor_validation(self):
         """Test feature extractor validation with invalid AP2 contract."""
@@ -153,6 +178,50 @@ class TestAP2FeatureExtractor:
         # Test with invalid contract (would need to create invalid contract)
         # This is tested in the rules engine tests
 
+    def test_payment_and_intent_risk_lookups(self):
+        """Test enum-keyed risk tables for payment and intent mandates."""
+        extractor = AP2FeatureExtractor()
+        payment = PaymentMandate(
+            instrument_ref="card_123",
+            modality=PaymentModality.DEFERRED,
+            auth_requirements=[AuthRequirement.PIN, AuthRequirement.NONE],
+        )
+        intent = IntentMandate(
+            actor=ActorType.SYSTEM,
+            intent_type=IntentType.INVESTMENT,
+            channel=ChannelType.VOICE,
+            agent_presence=AgentPresence.AUTONOMOUS,
+            timestamps={
+                "created": datetime.now(UTC),
+                "expires": datetime.now(UTC) + timedelta(hours=1),
+            },
+        )
+
+        payment_features = extractor._extract_payment_features(payment)
+        intent_features = extractor._extract_intent_features(intent)
+
+        assert payment_features["modality_risk"] == 0.3
+        assert payment_features["auth_requirement_risk"] == 0.5
+        assert intent_features == {
+            "actor_risk": 0.5,
+            "channel_risk": 0.4,
+            "agent_presence_risk": 0.4,
+            "intent_type_risk": 0.5,
+        }
+
+    def test_temporal_features_from_iso_string(self):
+        """Test that ISO timestamp strings are parsed (and cached) consistently."""
+        extractor = AP2FeatureExtractor()
+        intent = IntentMandate.model_construct(timestamps={"created": "2025-01-04T10:30:00Z"})
+
+        first = extractor._extract_temporal_features(intent)
+        second = extractor._extract_temporal_features(intent)
+
+        assert first == second
+        assert first["hour_of_day"] == 10.0
+        assert first["day_of_week"] == 5.0
+        assert first["is_weekend"] == 1.0
+
     def test_derived_features(self):
         """Test that derived features are calculated correctly."""
         legacy_data = {
@@ -508,6 +577,84 @@ class TestAP2RulesEngine:
         assert len(outcome.reasons) >= 1
         assert len(outcome.actions) >= 1
 
+    def test_rules_engine_skips_rules_missing_required_facets(self):
+        """Test that rules requiring absent contract facets are never applied."""
+
+        class GeoOnlyRule(AP2Rule):
+            required_mask = REQUIRES_GEO
+            calls = 0
+
+            def apply(self, ap2_contract):
+                GeoOnlyRule.calls += 1
+
+            @property
+            def name(self):
+                return "GEO_ONLY"
+
+        engine = AP2RulesEngine()
+        engine.add_rule(GeoOnlyRule())
+
+        contract = self.create_test_ap2_contract(amount=100.0)
+        contract.cart = contract.cart.model_copy(update={"geo": None})
+        engine.evaluate(contract)
+        assert GeoOnlyRule.calls == 0
+
+        engine.evaluate(self.create_test_ap2_contract(amount=100.0))
+        assert GeoOnlyRule.calls == 1
+
+    def test_calculate_risk_score_accumulates_reason_increments(self):
+        """Test that each known reason code raises the risk multiplier."""
+        engine = AP2RulesEngine()
+        reasons = [
+            create_decision_reason("high_ticket", "detail"),
+            create_decision_reason("velocity_flag", "detail"),
+            create_decision_reason("online_verification", "detail"),  # no increment
+        ]
+
+        risk_score = engine._calculate_risk_score({"composite_risk_score": 0.4}, reasons)
+
+        assert risk_score == pytest.approx(0.4 * 1.5)
+        assert engine._calculate_risk_score({"composite_risk_score": 0.9}, reasons) == 1.0
+
+    def test_rules_engine_risk_score_uses_composite_mandate_risk(self):
+        """Test that the base risk comes from the contract's mandates, not a default."""
+        contract = self.create_test_ap2_contract(amount=2500.0, modality=PaymentModality.DEFERRED)
+
+        outcome = AP2RulesEngine().evaluate(contract)
+
+        # human 0.1 + web 0.2 + deferred 0.3 + US 0.1 + card 0.2, averaged
+        assert outcome.result == "DECLINE"
+        assert outcome.risk_score == pytest.approx(0.18 * 1.2)  # + high_ticket
+
+        contract.cart = contract.cart.model_copy(update={"geo": None})  # unknown location
+        assert composite_risk_score(contract) == pytest.approx(1.3 / 5)
+
+    def test_adaptive_rules_engine_moves_declining_rules_first(self):
+        """Test that adaptive ordering promotes rules by DECLINE frequency."""
+        contract = self.create_test_ap2_contract(amount=2500.0, modality=PaymentModality.DEFERRED)
+
+        static_engine = AP2RulesEngine()
+        original_order = static_engine.get_rule_names()
+        static_engine.evaluate(contract)
+        assert static_engine.get_rule_names() == original_order
+
+        engine = AP2RulesEngine(adaptive=True, reorder_interval=1)
+        outcome = engine.evaluate(contract)
+
+        assert outcome.result == "DECLINE"
+        assert engine.rules[0].apply(contract).decision_hint == "DECLINE"
+        assert engine.get_rule_names() != original_order
+        assert sorted(engine.get_rule_names()) == sorted(original_order)
+        assert engine.evaluate(contract).result == "DECLINE"
+
+    def test_rules_engine_returns_contract_decision(self):
+        """Test that evaluate returns the outcome it stored on the contract."""
+        contract = self.create_test_ap2_contract(amount=100.0)
+
+        outcome = AP2RulesEngine().evaluate(contract)
+
+        assert outcome is contract.decision
+
     def test_rules_engine_validation_error(self):
         """Test rules engine with invalid contract."""
         engine = AP2RulesEngine()
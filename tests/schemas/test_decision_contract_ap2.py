@@ -234,6 +234,26 @@ class TestDecisionLegacyAdapter:
         assert ap2_contract.cart.currency == "USD"
         assert ap2_contract.payment.modality == PaymentModality.IMMEDIATE
         assert ap2_contract.payment.instrument_ref is not None
+        assert ap2_contract.metadata["legacy_request"] == legacy_request.model_dump()
+
+    def test_legacy_request_to_ap2_contract_matches_validated_schema(self):
+        """Test that the model_construct fast path still produces a schema-valid contract."""
+        ap2_contract = DecisionLegacyAdapter.legacy_request_to_ap2_contract(
+            {"cart_total": 99.99, "currency": "EUR", "rail": "ACH", "channel": "pos"}
+        )
+
+        contract_dict = ap2_contract.model_dump()
+        validated = AP2DecisionContract.model_validate(contract_dict)
+
+        assert validated.model_dump() == contract_dict
+        assert validated.model_dump_json() == ap2_contract.model_dump_json()
+
+    def test_legacy_request_to_ap2_contract_rejects_invalid_currency(self):
+        """Test that caller-supplied currency is still validated."""
+        with pytest.raises(ValueError):
+            DecisionLegacyAdapter.legacy_request_to_ap2_contract(
+                {"cart_total": 10.0, "currency": "usd"}
+            )
 
     def test_ap2_contract_to_legacy_response(self):
         """Test converting AP2 contract to legacy response."""
@@ -292,6 +312,28 @@ class TestDecisionLegacyAdapter:
         assert legacy_response.meta["risk_score"] == 0.65
         assert legacy_response.meta["rail"] == "Card"
         assert legacy_response.meta["channel"] == "online"
+        assert legacy_response.meta["rules_evaluated"] == ["high_ticket", "velocity_flag"]
+        assert legacy_response.signals_triggered == ["high_ticket", "velocity_flag"]
+        assert legacy_response.signals_triggered is not legacy_response.meta["rules_evaluated"]
+
+    def test_ap2_contract_to_legacy_response_without_enhanced_fields(self):
+        """Test that disabling enhanced fields leaves explanation fields empty."""
+        ap2_contract = DecisionLegacyAdapter.legacy_request_to_ap2_contract(
+            {"cart_total": 75.0, "currency": "USD", "rail": "ACH", "channel": "pos"}
+        )
+
+        legacy_response = DecisionLegacyAdapter.ap2_contract_to_legacy_response(
+            ap2_contract, include_enhanced_fields=False
+        )
+
+        assert legacy_response.decision == "APPROVE"
+        assert legacy_response.meta["rail"] == "ACH"
+        assert legacy_response.meta["channel"] == "pos"
+        assert legacy_response.meta["approved_amount"] == 75.0
+        assert legacy_response.signals_triggered == []
+        assert legacy_response.explanation == ""
+        assert legacy_response.explanation_human == ""
+        assert legacy_response.routing_hint == ""
 
     def test_update_ap2_contract_with_legacy_response(self):
         """Test updating AP2 contract with legacy response data."""
@@ -360,6 +402,78 @@ class TestDecisionLegacyAdapter:
         assert updated_contract.decision.reasons[0].code == "high_risk"
         assert updated_contract.decision.actions[0].type == "block_transaction"
 
+    def test_update_ap2_contract_does_not_share_legacy_reasons(self):
+        """Test that editing one contract's reason/action leaves later contracts unchanged."""
+        legacy_response = {
+            "decision": "REVIEW",
+            "reasons": ["high_ticket"],
+            "actions": ["manual_review"],
+        }
+        first = DecisionLegacyAdapter.legacy_request_to_ap2_contract({"cart_total": 10.0})
+        DecisionLegacyAdapter.update_ap2_contract_with_legacy_response(first, legacy_response)
+        first.decision.reasons[0].detail = "Edited detail"
+        first.decision.actions[0].detail = "Edited action"
+
+        second = DecisionLegacyAdapter.legacy_request_to_ap2_contract({"cart_total": 20.0})
+        DecisionLegacyAdapter.update_ap2_contract_with_legacy_response(second, legacy_response)
+
+        assert second.decision.reasons[0] is not first.decision.reasons[0]
+        assert second.decision.reasons[0].detail == "Legacy reason: high_ticket"
+        assert second.decision.actions[0].detail == "Legacy action: manual_review"
+
+    def test_update_ap2_contract_with_unvalidated_dict(self):
+        """Test the trusted dict path that skips LegacyDecisionResponse validation."""
+        legacy_response = {
+            "decision": "DECLINE",
+            "reasons": ["high_risk"],
+            "actions": ["block_transaction"],
+            "meta": {"risk_score": 0.9},
+        }
+        contract = DecisionLegacyAdapter.legacy_request_to_ap2_contract({"cart_total": 50.0})
+
+        updated = DecisionLegacyAdapter.update_ap2_contract_with_legacy_response(
+            contract, legacy_response, validate=False
+        )
+
+        assert updated.decision.result == "DECLINE"
+        assert updated.decision.risk_score == 0.9
+        assert updated.decision.reasons[0].code == "high_risk"
+        assert updated.decision.actions[0].type == "block_transaction"
+        assert updated.metadata["legacy_response"] == legacy_response
+
+        # The stored response is a copy: later edits by the caller do not leak in
+        assert updated.metadata["legacy_response"] is not legacy_response
+        legacy_response["meta"]["risk_score"] = 0.1
+        assert updated.metadata["legacy_response"]["meta"]["risk_score"] == 0.9
+
+    def test_update_ap2_contract_stores_copy_of_legacy_response(self):
+        """Test that a model response is stored as a full, independent dump."""
+        legacy_response = LegacyDecisionResponse(
+            decision="REVIEW", reasons=["high_ticket"], meta={"risk_score": 0.4}
+        )
+        contract = DecisionLegacyAdapter.legacy_request_to_ap2_contract({"cart_total": 50.0})
+
+        updated = DecisionLegacyAdapter.update_ap2_contract_with_legacy_response(
+            contract, legacy_response
+        )
+
+        assert updated.metadata["legacy_response"] == legacy_response.model_dump()
+        legacy_response.reasons.append("velocity_flag")
+        legacy_response.meta["risk_score"] = 0.1
+        assert updated.metadata["legacy_response"]["reasons"] == ["high_ticket"]
+        assert updated.metadata["legacy_response"]["meta"]["risk_score"] == 0.4
+
+    def test_update_ap2_contract_with_unvalidated_null_meta(self):
+        """Test that an unvalidated response with meta=None defaults the risk score."""
+        contract = DecisionLegacyAdapter.legacy_request_to_ap2_contract({"cart_total": 50.0})
+
+        updated = DecisionLegacyAdapter.update_ap2_contract_with_legacy_response(
+            contract, {"decision": "APPROVE", "meta": None}, validate=False
+        )
+
+        assert updated.decision.result == "APPROVE"
+        assert updated.decision.risk_score == 0.0
+
     def test_legacy_json_roundtrip(self):
         """Test JSON roundtrip through legacy adapter."""
         legacy_request_json = json.dumps(
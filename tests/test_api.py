@@ -1,8 +1,10 @@
 """Tests for the Orca API FastAPI service."""
 
+import inspect
+
 from fastapi.testclient import TestClient
 
-from src.orca_api.main import app
+from src.orca_api.main import app, explain_decision, make_decision, readiness_check
 
 # Create test client
 client = TestClient(app)
@@ -345,3 +347,8 @@ class TestAPIResponseFormat:
         request_data = {"decision": decision_data}
         response = client.post("/explain", json=request_data)
         assert response.headers["content-type"] == "application/json"
+
+    def test_blocking_handlers_run_in_threadpool(self):
+        """Test that CPU-bound handlers are sync so they do not block the event loop."""
+        for handler in (make_decision, explain_decision, readiness_check):
+            assert not inspect.iscoroutinefunction(handler)
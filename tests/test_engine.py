@@ -19,3 +19,26 @@ def test_standard_amount_approves() -> None:
     """Test that standard amounts are approved."""
     d = decide({"amount": 500})
     assert d.decision == "APPROVE"
+
+
+def test_decision_meta_is_per_call() -> None:
+    """Test that decisions carry their own trace id and independent meta."""
+    first = decide({"amount": 10, "trace_id": "t-1"})
+    second = decide({"amount": 10})
+
+    assert list(first.meta) == ["trace_id", "routing_hint", "explain"]
+    assert first.meta["trace_id"] == "t-1"
+    assert second.meta["trace_id"] == "unknown"
+
+    first.meta["routing_hint"] = "CHANGED"
+    assert second.meta["routing_hint"] == "LOW_RISK_ROUTING"
+
+
+def test_amount_band_boundaries() -> None:
+    """Test band edges and non-finite amounts follow the threshold rules."""
+    assert decide({"amount": 99.99}).reasons == ["low_amount"]
+    assert decide({"amount": 100}).reasons == ["standard_amount"]
+    assert decide({"amount": 1000}).reasons == ["standard_amount"]
+    assert decide({"amount": 1000.01}).reasons == ["high_amount"]
+    assert decide({}).reasons == ["low_amount"]
+    assert decide({"amount": float("nan")}).reasons == ["standard_amount"]
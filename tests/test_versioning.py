@@ -0,0 +1,122 @@
+"""Tests for Orca Core versioning module."""
+
+import json
+
+from src.orca.core.versioning import (
+    AP2_CONTENT_TYPE,
+    LEGACY_CONTENT_TYPE,
+    VersionManager,
+    attach_model_version_to_decision_meta,
+    create_version_info,
+    get_ap2_version,
+    get_content_type,
+    get_migration_path,
+    get_ml_model_version,
+    get_supported_versions,
+    get_version_manager,
+    is_ap2_compatible,
+    is_legacy_version,
+)
+
+
+class TestVersionPredicates:
+    """Test version comparison helpers."""
+
+    def test_ap2_compatibility(self):
+        """Test AP2 compatibility checks, including invalid versions."""
+        assert is_ap2_compatible("0.1.0")
+        assert is_ap2_compatible("0.1")
+        assert is_ap2_compatible("1.2.0")
+        assert not is_ap2_compatible("0.0.1")
+        assert not is_ap2_compatible("not-a-version")
+        assert not is_ap2_compatible("not-a-version")  # cached invalid result
+
+    def test_legacy_version(self):
+        """Test legacy version checks, treating invalid versions as legacy."""
+        assert is_legacy_version("0.0.0")
+        assert not is_legacy_version("0.0.1")  # the legacy version itself
+        assert not is_legacy_version("0.0.1.0")
+        assert not is_legacy_version("0.1.0")
+        assert is_legacy_version("not-a-version")
+
+    def test_migration_path(self):
+        """Test migration path selection between version pairs."""
+        assert get_migration_path("0.0.0", "0.1.0") == "legacy_to_ap2"
+        assert get_migration_path("0.1.0", "0.0.0") == "ap2_to_legacy"
+
+    def test_validate_version_compatibility(self):
+        """Test compatibility messages for matching, older, newer and invalid versions."""
+        manager = VersionManager()
+
+        assert manager.validate_version_compatibility("0.1.0", "0.1.0") == (
+            True,
+            "Versions match exactly",
+        )
+        assert manager.validate_version_compatibility("0.1.0", "0.2.0")[0]
+        assert not manager.validate_version_compatibility("0.3.0", "0.2.0")[0]
+        assert manager.validate_version_compatibility("0.1.0", "bogus") == (
+            False,
+            "Invalid version format: Invalid version: 'bogus'",
+        )
+
+
+class TestVersionInfo:
+    """Test version information payloads."""
+
+    def test_supported_versions_is_json_serializable_copy(self):
+        """Test that the supported versions payload is a plain copy that serializes."""
+        supported = get_supported_versions()
+
+        assert json.loads(json.dumps(supported)) == supported
+        assert supported["ap2"]["version"] == "0.1.0"
+        assert supported["legacy"]["migration_to"] == ["ap2"]
+
+        # Changing one copy does not affect the next call
+        supported["ap2"]["version"] = "9.9.9"
+        supported["ap2"]["features"].append("extra")
+        fresh = get_supported_versions()
+        assert fresh["ap2"]["version"] == "0.1.0"
+        assert "extra" not in fresh["ap2"]["features"]
+
+    def test_create_version_info(self):
+        """Test version info for AP2 and legacy contracts, with and without model meta."""
+        assert create_version_info("legacy") == {
+            "contract_version": "0.0.1",
+            "contract_type": "legacy",
+            "content_type": LEGACY_CONTENT_TYPE,
+        }
+
+        info = create_version_info("ap2", {"model_version": "2.0.0"})
+        assert info["content_type"] == AP2_CONTENT_TYPE
+        assert info["model_version"] == "2.0.0"
+        assert info["model_sha256"] == "unknown"
+        assert info["trained_on"] == "unknown"
+
+    def test_module_helpers_match_global_manager(self):
+        """Test that module-level helpers agree with the global version manager."""
+        manager = get_version_manager()
+
+        assert manager is get_version_manager()
+        assert get_ap2_version() == manager.get_ap2_version()
+        assert get_ml_model_version() == manager.get_ml_model_version()
+        assert get_content_type() == manager.get_content_type(True)
+        assert get_content_type(False) == manager.get_content_type(False)
+
+    def test_attach_model_version_to_decision_meta(self):
+        """Test that model version info is merged without modifying the input."""
+        decision_meta = {"trace_id": "trace-1", "model_version": "old"}
+
+        updated = attach_model_version_to_decision_meta(decision_meta)
+        assert decision_meta == {"trace_id": "trace-1", "model_version": "old"}
+        assert updated["trace_id"] == "trace-1"
+        assert updated["model_version"] == get_ml_model_version()
+        assert "model_sha256" not in updated
+        assert updated["version_info"]["contract_type"] == "ap2"
+
+        updated = attach_model_version_to_decision_meta(
+            decision_meta, {"model_version": "2.0.0", "model_sha256": "abc"}
+        )
+        assert updated["model_version"] == "2.0.0"
+        assert updated["model_sha256"] == "abc"
+        assert updated["model_trained_on"] == "unknown"
+        assert updated["version_info"]["model_version"] == "2.0.0"